@@ -72,7 +72,9 @@ def main():
     from ompi_bindings.util import OutputFile
 
     with open(args.output, 'w') as f:
-        args.handler(args, OutputFile(f))
+        out = OutputFile(f)
+        args.handler(args, out)
+        out.flush()
 
 
 if __name__ == '__main__':
@@ -15,6 +15,9 @@ subroutines in one file and the C wraping code in another for all prototypes
 listed.
 """
 from collections import namedtuple
+import concurrent.futures
+import functools
+import io
 import json
 import re
 from ompi_bindings import consts, util
@@ -33,11 +36,11 @@ class FortranBinding:
         self.template = template
         self.needs_ts = needs_ts
         self.gen_f90 = gen_f90
-        self.parameters = []
-        for param in self.template.prototype.params:
-            self.parameters.append(param.construct(fn_name=self.fn_name,
-                                                   bigcount=bigcount,
-                                                   gen_f90=gen_f90))
+        factory = FortranType.make_factory(bigcount=bigcount, gen_f90=gen_f90)
+        self.parameters = [factory[param.type_name](name=param.name,
+                                                    count_param=param.count_param,
+                                                    fn_name=self.fn_name)
+                           for param in self.template.prototype.params]
 
     def dump(self, *pargs, **kwargs):
         """Write to the output file."""
@@ -136,7 +139,7 @@ class FortranBinding:
                 self.dump_lines(param.interface_predeclare())
             self.dump_lines(param.declare())
         # Add the integer error manually
-        if self.gen_f90 == True:
+        if self.gen_f90:
             self.dump(f'    INTEGER, INTENT(OUT) :: {consts.FORTRAN_ERROR_NAME}')
         else:
             self.dump(f'    INTEGER, OPTIONAL, INTENT(OUT) :: {consts.FORTRAN_ERROR_NAME}')
@@ -166,10 +169,14 @@ class FortranBinding:
         self._print_fortran_subroutine()
         self._print_fortran_header()
 
+        # Render each parameter once; the loops below only read the tuples
+        rendered = [param.render() for param in self.parameters]
+
         # Temporaries
         self.dump(f'    INTEGER :: {consts.C_ERROR_TMP_NAME}')
-        for param in self.parameters:
-            self.dump_lines(param.declare_tmp())
+        for r in rendered:
+            if r.declare_tmp:
+                self.dump_lines(r.declare_tmp)
 
         # Interface for call to C function
         self.dump()
@@ -178,12 +185,13 @@ class FortranBinding:
 
         # Output in pre C function call methods
 
-        for param in self.parameters:
-            self.dump_lines(param.pre_c_call())
+        for r in rendered:
+            if r.pre_c_call:
+                self.dump_lines(r.pre_c_call)
 
         # Call into the C function
         call_start = f'    call {self.c_func_name}('
-        params = [param.argument() for param in self.parameters]
+        params = [r.argument for r in rendered]
         params.append(consts.C_ERROR_TMP_NAME)
         lines = util.break_param_lines_fortran(start=call_start, params=params, end=')')
         for line in lines:
@@ -192,8 +200,9 @@ class FortranBinding:
         # Convert error type
         self.dump(f'    if (present({consts.FORTRAN_ERROR_NAME})) {consts.FORTRAN_ERROR_NAME} = {consts.C_ERROR_TMP_NAME}')
 
-        for param in self.parameters:
-            self.dump_lines(param.post())
+        for r in rendered:
+            if r.post:
+                self.dump_lines(r.post)
 
         self._print_fortran_subroutine_end()
 
@@ -246,7 +255,7 @@ def print_profiling_rename_macros(templates, out, args):
         if util.prototype_has_bigcount(template.prototype):
             bigcount_name = util.fortran_name(template.prototype.name, bigcount=True, needs_ts=needs_ts)
             out.dump(f'#define {bigcount_name} P{bigcount_name}')
-        if gen_f90 == False:
+        if not gen_f90:
             name = util.fortran_f08_generic_interface_name(template.prototype.name)
             out.dump(f'#define {name} P{name}')
     out.dump('#endif /* OMPI_BUILD_MPI_PROFILING */')
@@ -282,6 +291,43 @@ def print_binding(prototype, lang, out, bigcount=False, template=None, needs_ts=
         binding.print_c_source()
 
 
+def _render_template_file(fname, lang, generate_ts_suffix, gen_f90):
+    """Render the bindings for one template file to a string.
+
+    Module-level so it can be dispatched to worker processes; each worker
+    parses its own template instead of receiving a pickled one.
+    """
+    template = SourceTemplate.load(fname, type_constructor=FortranType.construct)
+    buffer = io.StringIO()
+    out = util.OutputFile(buffer)
+    out.dump()
+    has_buffers = util.prototype_has_buffers(template.prototype)
+    needs_ts = has_buffers and generate_ts_suffix
+    print_binding(template.prototype, lang, out, template=template, needs_ts=needs_ts, gen_f90=gen_f90)
+    if util.prototype_has_bigcount(template.prototype) and not gen_f90:
+        out.dump()
+        print_binding(template.prototype, lang, bigcount=True, out=out, template=template, needs_ts=needs_ts)
+    out.flush()
+    return buffer.getvalue()
+
+
+def _render_template_files(prototype_files, lang, generate_ts_suffix, gen_f90):
+    """Render every template file, in parallel where the host allows it.
+
+    Each template is independent and renders to its own string, so the
+    results can be emitted in input order regardless of completion order.
+    """
+    render = functools.partial(_render_template_file, lang=lang,
+                               generate_ts_suffix=generate_ts_suffix,
+                               gen_f90=gen_f90)
+    try:
+        with concurrent.futures.ProcessPoolExecutor() as pool:
+            return list(pool.map(render, prototype_files, chunksize=8))
+    except (OSError, concurrent.futures.process.BrokenProcessPool):
+        # Restricted environments may not permit worker processes.
+        return [render(fname) for fname in prototype_files]
+
+
 def load_function_templates(prototype_files):
     """Load the templates from a file list."""
     return [
@@ -294,7 +340,7 @@ def generate_code(args, out):
     """Generate binding code based on arguments."""
     templates = load_function_templates(args.prototype_files)
 
-    if args.fort_std == 'f08' or args.fort_std == None:
+    if args.fort_std == 'f08' or args.fort_std is None:
         gen_f90 = False
     else:
         gen_f90 = True
@@ -307,14 +353,9 @@ def generate_code(args, out):
     else:
         print_c_source_header(out)
 
-    for template in templates:
-        out.dump()
-        has_buffers = util.prototype_has_buffers(template.prototype)
-        needs_ts = has_buffers and args.generate_ts_suffix
-        print_binding(template.prototype, args.lang, out, template=template, needs_ts=needs_ts, gen_f90=gen_f90)
-        if util.prototype_has_bigcount(template.prototype) and gen_f90 == False:
-            out.dump()
-            print_binding(template.prototype, args.lang, bigcount=True, out=out, template=template, needs_ts=needs_ts)
+    for source in _render_template_files(args.prototype_files, args.lang,
+                                         args.generate_ts_suffix, gen_f90):
+        out.dump(source, end='')
 
 
 def generate_interface(args, out):
@@ -324,7 +365,7 @@ def generate_interface(args, out):
     templates = load_function_templates(args.prototype_files)
     print_profiling_rename_macros(templates, out, args)
 
-    if args.fort_std == 'f08' or args.fort_std == None:
+    if args.fort_std == 'f08' or args.fort_std is None:
         gen_f90 = False
     else:
         gen_f90 = True
@@ -336,7 +377,7 @@ def generate_interface(args, out):
         needs_ts = has_buffers and args.generate_ts_suffix
         binding = FortranBinding(template.prototype, template=template, needs_ts=needs_ts, gen_f90=gen_f90, out=out)
         binding.print_interface()
-        if util.prototype_has_bigcount(template.prototype) and gen_f90 == False:
+        if util.prototype_has_bigcount(template.prototype) and not gen_f90:
             out.dump()
             binding_c = FortranBinding(template.prototype, out=out, template=template,
                                        needs_ts=needs_ts, bigcount=True)
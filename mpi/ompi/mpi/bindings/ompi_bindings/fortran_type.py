@@ -14,29 +14,152 @@ from the FortranType base class. These are used for generating both Fortran and
 supporting C code for the mpi_f08 bindings.
 """
 from abc import ABC, abstractmethod
+from collections import namedtuple
+import functools
+import sys
+import types
+from typing import Optional
+
 from ompi_bindings import consts, util
 
+def _use(*pairs):
+    """Build a use() tuple with interned module/symbol names.
+
+    The generator dedupes use() results through sets and dicts; interning
+    the recurring names reduces those membership tests to pointer
+    compares.
+    """
+    return tuple((sys.intern(mod), sys.intern(sym)) for mod, sym in pairs)
+
+
+# Shared use() results. The generator iterates and unions these into the
+# use-statements of every binding, so they are immutable module-level
+# constants rather than per-call list literals.
+_USE_EMPTY = ()
+_USE_DATATYPE = _use(('mpi_f08_types', 'MPI_Datatype'))
+_USE_COMM = _use(('mpi_f08_types', 'MPI_Comm'))
+_USE_GROUP = _use(('mpi_f08_types', 'MPI_Group'))
+_USE_SESSION = _use(('mpi_f08_types', 'MPI_Session'))
+_USE_REQUEST = _use(('mpi_f08_types', 'MPI_Request'))
+_USE_STATUS = _use(('mpi_f08_types', 'MPI_Status'))
+_USE_STATUS_SIZE = _use(('mpi_f08_types', 'MPI_STATUS_SIZE'))
+_USE_COUNT_KIND = _use(('mpi_f08_types', 'MPI_COUNT_KIND'))
+_USE_ADDRESS_KIND = _use(('mpi_f08_types', 'MPI_ADDRESS_KIND'))
+_USE_C_PTR = _use(('ISO_C_BINDING', 'C_PTR'))
+_USE_OFFSET_KIND = _use(('mpi_f08_types', 'MPI_OFFSET_KIND'))
+
+# Include file providing the MPI_* kind constants to the f90 interface.
+_MPIF_CONFIG_INCLUDE = sys.intern('mpif-config.h')
+
+# iso_c_binding symbols needed by every callback type, plus a helper that
+# builds the shared f08 use() tuple for one callback interface.
+_USE_CHAR = _use(('iso_c_binding', 'c_char'), ('iso_c_binding', 'c_null_char'))
+_USE_FUNLOC = _use(('iso_c_binding', 'c_funloc'), ('iso_c_binding', 'c_funptr'))
+
+# use() tuples for CharArrayOut, keyed by the MPI length constant that sizes
+# the character buffer; buffers sized by an ordinary parameter only need
+# c_char.
+_USE_C_CHAR = _use(('iso_c_binding', 'c_char'))
+_CHAR_OUT_USE = {
+    name: _USE_C_CHAR + _use(('mpi_f08_types', name))
+    for name in ('MPI_MAX_OBJECT_NAME', 'MPI_MAX_PORT_NAME',
+                 'MPI_MAX_ERROR_STRING', 'MPI_MAX_PROCESSOR_NAME',
+                 'MPI_MAX_LIBRARY_VERSION_STRING', 'MPI_STATUS_SIZE')
+}
+
+
+def _use_callback(fn_interface):
+    return _use(('mpi_f08_interfaces_callbacks', fn_interface)) + _USE_FUNLOC
+
+
+@functools.lru_cache(maxsize=None)
+def _api_name(fn_name, bigcount):
+    """Memoized API name; every parameter of a binding shares fn_name."""
+    return util.ext_api_func_name(fn_name, bigcount=bigcount).upper()
+
+
+# All per-parameter strings needed to emit one Fortran subroutine, rendered
+# in a single pass over the parameter (see FortranType.render()).
+RenderedType = namedtuple('RenderedType', ['declare', 'declare_tmp', 'argument',
+                                           'pre_c_call', 'post', 'use', 'include'])
+
 
 class FortranType(ABC):
 
-    def __init__(self, name, fn_name, bigcount=False, count_param=None, gen_f90=False, **kwargs):
-        self.name = name
-        self.fn_name = fn_name
+    # Instances are created in bulk by the binding generator (one per
+    # parameter per generated function); __slots__ avoids a per-instance
+    # __dict__ and speeds up the attribute loads in the hot methods. The
+    # underscore names are the caches filled in by _bind_variants().
+    __slots__ = ('name', 'fn_name', 'bigcount', 'count_param', 'gen_f90',
+                 'used_counters', '_declare', '_decl_suffix', '_argument',
+                 '_use', '_include', '_cpar',
+                 '_fn_api_name', '_tmp_name', '_tmp_name2')
+
+    def __init__(self, name: str, fn_name: str, bigcount: bool = False,
+                 count_param: Optional[str] = None, gen_f90: bool = False, **kwargs):
+        # Intern the names: the same parameter/function names recur across
+        # bindings, and interning makes the many concatenations and
+        # set/dict operations on them cheaper.
+        self.name = sys.intern(name)
+        self.fn_name = sys.intern(fn_name)
         # Generate the bigcount interface version?
         self.bigcount = bigcount
-        self.count_param = count_param
+        # The same count parameter names (MPI_MAX_* constants, shared array
+        # lengths) recur across prototypes; interned they hash and compare
+        # as pointers in the lookups keyed on them.
+        self.count_param = count_param if count_param is None else sys.intern(count_param)
         self.gen_f90 = gen_f90
         self.used_counters = 0
+        self._fn_api_name = None
+        self._tmp_name = None
+        self._tmp_name2 = None
+        self._bind_variants()
+
+    def _bind_variants(self):
+        """Bind flag-dependent output to the instance.
+
+        Subclasses whose generated code depends on bigcount/gen_f90 override
+        this to select the variant strings once at construction instead of
+        re-evaluating the flags on every method call.
+        """
+
+    # Most types have no temporary declaration or pre/post-call code; these
+    # flags let the generator skip the method calls entirely instead of
+    # collecting and discarding empty strings. Subclasses that implement
+    # one of the methods set the matching flag.
+    HAS_TMP_DECL = False
+    HAS_PRE_C_CALL = False
+    HAS_POST = False
 
     TYPES = {}
+    # class name -> constructor; guards against two registered classes
+    # accidentally sharing a name (partials carry no name and are exempt).
+    _CLASS_NAMES = {}
+
+    def __init_subclass__(cls, type_name=None, **kwargs):
+        """Register subclasses declared with a type_name class keyword."""
+        super().__init_subclass__(**kwargs)
+        if type_name is not None:
+            FortranType.register(type_name, cls)
 
     @classmethod
-    def add(cls, type_name):
-        """Decorator for adding types."""
-        def wrapper(class_):
-            cls.TYPES[type_name] = class_
-            return class_
-        return wrapper
+    def register(cls, type_name, constructor):
+        """Register a type constructor under a unique type name.
+
+        The name is interned -- it is compared against every prototype
+        parameter during generation -- and registering a name twice is an
+        import-time error rather than a silent override. Two different
+        classes sharing a __name__ (as the ERRHANDLER_OUT/INOUT pair once
+        did) are rejected as well, since that defeats tracebacks and any
+        registry introspection.
+        """
+        type_name = sys.intern(type_name)
+        assert type_name not in cls.TYPES, f'duplicate type name: {type_name}'
+        class_name = getattr(constructor, '__name__', None)
+        if class_name is not None:
+            registered = cls._CLASS_NAMES.setdefault(class_name, constructor)
+            assert registered is constructor, f'duplicate class name: {class_name}'
+        cls.TYPES[type_name] = constructor
 
     @classmethod
     def get(cls, type_name):
@@ -44,47 +167,76 @@ class FortranType(ABC):
 
     @classmethod
     def construct(cls, type_name, **kwargs):
-        type_ = cls.TYPES[type_name]
-        return type_(**kwargs)
+        return cls.TYPES[type_name](**kwargs)
+
+    # Factories with the generation flags pre-bound, keyed on the flag pair.
+    _FACTORIES = {}
+
+    @classmethod
+    def make_factory(cls, bigcount=False, gen_f90=False):
+        """Return a map of type constructors with the flags already bound.
+
+        The binding generator constructs one type instance per parameter per
+        generated function, always with the same bigcount/gen_f90 pair for a
+        whole binding; binding the flags once avoids re-packing them into
+        kwargs for every parameter.
+        """
+        key = (bigcount, gen_f90)
+        try:
+            return cls._FACTORIES[key]
+        except KeyError:
+            factory = {name: functools.partial(type_, bigcount=bigcount, gen_f90=gen_f90)
+                       for name, type_ in cls.TYPES.items()}
+            cls._FACTORIES[key] = factory
+            return factory
+
+    # The following properties are pure functions of fields that never
+    # change after construction, so they are computed once and cached.
 
     @property
-    def fn_api_name(self):
+    def fn_api_name(self) -> str:
         """Return the MPI API name to be used in error messages, etc.."""
-        return util.ext_api_func_name(self.fn_name, bigcount=self.bigcount).upper()
+        if self._fn_api_name is None:
+            self._fn_api_name = _api_name(self.fn_name, self.bigcount)
+        return self._fn_api_name
 
     @property
-    def tmp_name(self):
+    def tmp_name(self) -> str:
         """Return a temporary name for use in C."""
-        return f'c_{self.name}'
+        if self._tmp_name is None:
+            self._tmp_name = 'c_' + self.name
+        return self._tmp_name
 
     @property
-    def tmp_name2(self):
+    def tmp_name2(self) -> str:
         """Return a secondary temporary name for use in C."""
-        return f'c_{self.name}2'
+        if self._tmp_name2 is None:
+            self._tmp_name2 = 'c_' + self.name + '2'
+        return self._tmp_name2
 
-    def tmp_counter(self):
+    def tmp_counter(self) -> str:
         """Get a temporary counter variable to be used in a loop."""
         name = f'{self.name}_i_{self.used_counters}'
         self.used_counters += 1
         return name
 
-    def interface_predeclare(self):
+    def interface_predeclare(self) -> str:
         """Return predeclaration code, if required for the interface."""
         return ''
 
     @abstractmethod
-    def declare(self):
+    def declare(self) -> str:
         """Return a declaration for the type."""
 
-    def declare_tmp(self):
+    def declare_tmp(self) -> str:
         """Declare temporaries on in the subroutine."""
         return ''
 
-    def declare_cbinding_fortran(self):
+    def declare_cbinding_fortran(self) -> str:
         """Return the C binding declaration as seen from Fortran."""
         return self.declare()
 
-    def argument(self):
+    def argument(self) -> str:
         """Return the value to pass as an argument."""
         return self.name
 
@@ -92,319 +244,368 @@ class FortranType(ABC):
         """Return list of (module, name) for a Fortran use-statement."""
         return []
 
-    def include(self):
+    def include(self) -> str:
         """Return an include file name needed for a Fortran datatype."""
         return ''
 
-    def post(self):
+    def post(self) -> str:
         """Return post-processing code to be run after the call."""
         return ''
 
-    def pre_c_call(self):
+    def pre_c_call(self) -> str:
         """Return pre-processing code to be run before the call the c interface."""
         return ''
 
     @abstractmethod
-    def c_parameter(self):
+    def c_parameter(self) -> str:
         """Return the parameter expression to be used in the C function."""
 
+    def render(self) -> 'RenderedType':
+        """Render all Fortran-side strings for this parameter in one pass.
+
+        The generator visits every parameter several times while printing a
+        subroutine; rendering once up front replaces the repeated method
+        dispatch with plain tuple field loads.
+        """
+        return RenderedType(self.declare(),
+                            self.declare_tmp() if self.HAS_TMP_DECL else '',
+                            self.argument(),
+                            self.pre_c_call() if self.HAS_PRE_C_CALL else '',
+                            self.post() if self.HAS_POST else '',
+                            self.use(),
+                            self.include())
+
 #
 # Definitions of generic types in Fortran and how these can be converted
 # to and from C.
 #
 
-@FortranType.add('BUFFER')
 class BufferType(FortranType):
+    """Ignore-TKR buffer type, covering the out/asynchronous variants.
+
+    The four BUFFER* type names are registered below as partial
+    constructors over the (out, asynchronous) flags rather than as four
+    separate subclasses.
+    """
+    __slots__ = ('_decl_prefix',)
+    _CPAR_PREFIX = 'OMPI_CFI_BUFFER *'
+    _DECL_PREFIXES = {
+        (False, False): 'OMPI_F08_IGNORE_TKR_TYPE, INTENT(IN) :: ',
+        (False, True): 'OMPI_F08_IGNORE_TKR_TYPE, INTENT(IN) OMPI_ASYNCHRONOUS :: ',
+        (True, False): 'OMPI_F08_IGNORE_TKR_TYPE :: ',
+        (True, True): 'OMPI_F08_IGNORE_TKR_TYPE OMPI_ASYNCHRONOUS :: ',
+    }
+
+    def __init__(self, out=False, asynchronous=False, **kwargs):
+        self._decl_prefix = self._DECL_PREFIXES[(out, asynchronous)]
+        super().__init__(**kwargs)
+
     def interface_predeclare(self):
-        return f'!OMPI_F08_IGNORE_TKR_PREDECL {self.name}'
+        return '!OMPI_F08_IGNORE_TKR_PREDECL ' + self.name
 
     def declare(self):
-        return f'OMPI_F08_IGNORE_TKR_TYPE, INTENT(IN) :: {self.name}'
+        return self._decl_prefix + self.name
 
     def c_parameter(self):
         # See fortran/use-mpi-f08/base/ts.h; OMPI_CFI_BUFFER is expanded based
         # on whether or not the compiler supports TS 29113.
-        return f'OMPI_CFI_BUFFER *{self.name}'
-
-
-@FortranType.add('BUFFER_ASYNC')
-class BufferAsyncType(BufferType):
-    def declare(self):
-        return f'OMPI_F08_IGNORE_TKR_TYPE, INTENT(IN) OMPI_ASYNCHRONOUS :: {self.name}'
+        return self._CPAR_PREFIX + self.name
 
 
-@FortranType.add('BUFFER_OUT')
-class BufferOutType(BufferType):
-    def declare(self):
-        return f'OMPI_F08_IGNORE_TKR_TYPE :: {self.name}'
-
-
-@FortranType.add('BUFFER_ASYNC_OUT')
-class BufferAsyncOutType(BufferType):
-    def declare(self):
-        return f'OMPI_F08_IGNORE_TKR_TYPE OMPI_ASYNCHRONOUS :: {self.name}'
+FortranType.register('BUFFER', BufferType)
+FortranType.register('BUFFER_ASYNC', functools.partial(BufferType, asynchronous=True))
+FortranType.register('BUFFER_OUT', functools.partial(BufferType, out=True))
+FortranType.register('BUFFER_ASYNC_OUT', functools.partial(BufferType, out=True, asynchronous=True))
 
 
-@FortranType.add('VBUFFER')
-class VBufferType(FortranType):
+class VBufferType(FortranType, type_name='VBUFFER'):
     """Variable buffer type, as used by MPI_*v() functions."""
+    __slots__ = ()
+    _DECL_PREFIX = 'OMPI_F08_IGNORE_TKR_TYPE, INTENT(IN) :: '
+    _CPAR_PREFIX = 'OMPI_CFI_BUFFER *'
+
     def declare(self):
-        return f'OMPI_F08_IGNORE_TKR_TYPE, INTENT(IN) :: {self.name}'
+        return self._DECL_PREFIX + self.name
 
     def c_parameter(self):
-        return f'OMPI_CFI_BUFFER *{self.name}'
+        return self._CPAR_PREFIX + self.name
 
 
-@FortranType.add('VBUFFER_OUT')
-class VBufferType(FortranType):
+class VBufferOutType(VBufferType, type_name='VBUFFER_OUT'):
     """Variable buffer receive type, as used by MPI_*v() functions."""
-    def declare(self):
-        return f'OMPI_F08_IGNORE_TKR_TYPE :: {self.name}'
-
-    def c_parameter(self):
-        return f'OMPI_CFI_BUFFER *{self.name}'
+    __slots__ = ()
+    _DECL_PREFIX = 'OMPI_F08_IGNORE_TKR_TYPE :: '
 
 
-@FortranType.add('WBUFFER')
-class WBufferType(FortranType):
+class WBufferType(FortranType, type_name='WBUFFER'):
     """Variable buffer send type, used with MPI_*w() functions."""
+    __slots__ = ()
+    _DECL_PREFIX = 'OMPI_F08_IGNORE_TKR_TYPE, INTENT(IN) :: '
+    _CPAR_PREFIX = 'OMPI_CFI_BUFFER *'
+
     def declare(self):
-        return f'OMPI_F08_IGNORE_TKR_TYPE, INTENT(IN) :: {self.name}'
+        return self._DECL_PREFIX + self.name
 
     def c_parameter(self):
-        return f'OMPI_CFI_BUFFER *{self.name}'
+        return self._CPAR_PREFIX + self.name
 
 
-@FortranType.add('WBUFFER_OUT')
-class WBufferType(FortranType):
+class WBufferOutType(WBufferType, type_name='WBUFFER_OUT'):
     """Variable buffer receive type, used with MPI_*w() functions."""
-    def declare(self):
-        return f'OMPI_F08_IGNORE_TKR_TYPE :: {self.name}'
+    __slots__ = ()
+    _DECL_PREFIX = 'OMPI_F08_IGNORE_TKR_TYPE :: '
 
-    def c_parameter(self):
-        return f'OMPI_CFI_BUFFER *{self.name}'
 
+class CptrType(FortranType, type_name='C_PTR_OUT'):
+    __slots__ = ()
 
-@FortranType.add('C_PTR_OUT')
-class CptrType(FortranType):
     def declare(self):
-        return f'TYPE(C_PTR), INTENT(OUT) :: {self.name}'
+        return 'TYPE(C_PTR), INTENT(OUT) :: ' + self.name
 
     def use(self):
-        return [('ISO_C_BINDING', 'C_PTR')]
+        return _USE_C_PTR
 
     def c_parameter(self):
-        return f'char *{self.name}'
+        return 'char *' + self.name
 
-@FortranType.add('COUNT')
-class CountType(FortranType):
-    def declare(self):
+class CountType(FortranType, type_name='COUNT'):
+    __slots__ = ()
+    _INTENT = 'IN'
+
+    def _bind_variants(self):
         if self.bigcount:
-            return f'INTEGER(KIND=MPI_COUNT_KIND), INTENT(IN) :: {self.name}'
+            self._declare = f'INTEGER(KIND=MPI_COUNT_KIND), INTENT({self._INTENT}) :: '
+            self._cpar = 'MPI_Count *'
         else:
-            return f'INTEGER, INTENT(IN) :: {self.name}'
+            self._declare = f'INTEGER, INTENT({self._INTENT}) :: '
+            self._cpar = 'MPI_Fint *'
+        self._use = _USE_COUNT_KIND if not self.gen_f90 else _USE_EMPTY
+        self._include = '' if not self.gen_f90 else _MPIF_CONFIG_INCLUDE
+
+    def declare(self):
+        return self._declare + self.name
 
     def use(self):
-        if self.gen_f90 == False:
-            return [('mpi_f08_types', 'MPI_COUNT_KIND')]
-        else:
-            return []
+        return self._use
 
     def include(self):
-        if self.gen_f90 == False:
-            return ''
-        else:
-            return f"mpif-config.h"
+        return self._include
 
     def c_parameter(self):
-        type_ = 'MPI_Count' if self.bigcount else 'MPI_Fint'
-        return f'{type_} *{self.name}'
+        return self._cpar + self.name
 
-@FortranType.add('COUNT_INOUT')
-class CountTypeInOut(CountType):
+class CountTypeInOut(CountType, type_name='COUNT_INOUT'):
     """COUNT type with INOUT INTENT"""
-    def declare(self):
-        if self.bigcount:
-            return f'INTEGER(KIND=MPI_COUNT_KIND), INTENT(INOUT) :: {self.name}'
-        else:
-            return f'INTEGER, INTENT(INOUT) :: {self.name}'
+    __slots__ = ()
+    _INTENT = 'INOUT'
 
-@FortranType.add('COUNT_OUT')
-class CountTypeInOut(CountType):
+class CountTypeOut(CountType, type_name='COUNT_OUT'):
     """COUNT type with OUT INTENT"""
-    def declare(self):
-        if self.bigcount:
-            return f'INTEGER(KIND=MPI_COUNT_KIND), INTENT(OUT) :: {self.name}'
-        else:
-            return f'INTEGER, INTENT(OUT) :: {self.name}'
+    __slots__ = ()
+    _INTENT = 'OUT'
 
 
-@FortranType.add('PARTITIONED_COUNT')
-class PartitionedCountType(FortranType):
+class PartitionedCountType(FortranType, type_name='PARTITIONED_COUNT'):
+    __slots__ = ()
+
+    def _bind_variants(self):
+        self._use = _USE_COUNT_KIND if not self.gen_f90 else _USE_EMPTY
+
     def declare(self):
-            return f'INTEGER(KIND=MPI_COUNT_KIND), INTENT(IN) :: {self.name}'
+            return 'INTEGER(KIND=MPI_COUNT_KIND), INTENT(IN) :: ' + self.name
 
     def use(self):
-        if self.gen_f90 == False:
-            return [('mpi_f08_types', 'MPI_COUNT_KIND')]
-        else:
-            return []
+        return self._use
 
     def c_parameter(self):
-        return f'MPI_Count *{self.name}'
+        return 'MPI_Count *' + self.name
 
 
-@FortranType.add('DATATYPE')
-class DatatypeType(FortranType):
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'TYPE(MPI_Datatype), INTENT(IN) :: {self.name}'
-        else:
-            return f'INTEGER, INTENT(IN) :: {self.name}'
+
+class _FintCBinding:
+    """Mixin: handle passed to the C binding as a Fortran INTEGER.
+
+    The f08 interface declares the typed handle, but the BIND(C)
+    interface always takes the integer handle with the class's intent.
+    """
+    __slots__ = ()
 
     def declare_cbinding_fortran(self):
-        return f'INTEGER, INTENT(IN) :: {self.name}'
+        return f'INTEGER, INTENT({self._INTENT}) :: {self.name}'
+
+
+class _MPIValArgument:
+    """Mixin: pass the %MPI_VAL component for both interfaces."""
+    __slots__ = ()
 
     def argument(self):
-        if self.gen_f90 == False:
-            return f'{self.name}%MPI_VAL'
+        return self.name + '%MPI_VAL'
+
+
+class DatatypeType(_FintCBinding, FortranType, type_name='DATATYPE'):
+    __slots__ = ()
+    _INTENT = 'IN'
+
+    def _bind_variants(self):
+        if not self.gen_f90:
+            self._declare = f'TYPE(MPI_Datatype), INTENT({self._INTENT}) :: '
+            self._argument = self.name + '%MPI_VAL'
+            self._use = _USE_DATATYPE
         else:
-            return f'{self.name}'
+            self._declare = f'INTEGER, INTENT({self._INTENT}) :: '
+            self._argument = self.name
+            self._use = _USE_EMPTY
+
+    def declare(self):
+        return self._declare + self.name
+
+    def argument(self):
+        return self._argument
 
     def use(self):
-        if self.gen_f90 == False:
-            return [('mpi_f08_types', 'MPI_Datatype')]
-        else:
-            return []
+        return self._use
 
     def c_parameter(self):
-        return f'MPI_Fint *{self.name}'
+        return 'MPI_Fint *' + self.name
 
-@FortranType.add('DATATYPE_OUT')
-class DatatypeTypeOut(DatatypeType):
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'TYPE(MPI_Datatype), INTENT(OUT) :: {self.name}'
-        else:
-            return f'INTEGER, INTENT(OUT) :: {self.name}'
+class DatatypeTypeOut(DatatypeType, type_name='DATATYPE_OUT'):
+    __slots__ = ()
+    _INTENT = 'OUT'
 
-    def declare_cbinding_fortran(self):
-        return f'INTEGER, INTENT(OUT) :: {self.name}'
+class DatatypeTypeInOut(DatatypeType, type_name='DATATYPE_INOUT'):
+    __slots__ = ()
+    _INTENT = 'INOUT'
 
-@FortranType.add('DATATYPE_INOUT')
-class DatatypeTypeInOut(DatatypeType):
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'TYPE(MPI_Datatype), INTENT(INOUT) :: {self.name}'
-        else:
-            return f'INTEGER, INTENT(INOUT) :: {self.name}'
+class DatatypeArrayType(FortranType, type_name='DATATYPE_ARRAY'):
+    __slots__ = ()
 
-    def declare_cbinding_fortran(self):
-        return f'INTEGER, INTENT(INOUT) :: {self.name}'
+    def _bind_variants(self):
+        if not self.gen_f90:
+            self._declare = 'TYPE(MPI_Datatype), INTENT(IN) :: '
+            self._use = _USE_DATATYPE
+        else:
+            self._declare = 'INTEGER, INTENT(IN) :: '
+            self._use = _USE_EMPTY
 
-@FortranType.add('DATATYPE_ARRAY')
-class DatatypeArrayType(FortranType):
     def declare(self):
-        if self.gen_f90 == False:
-            return f'TYPE(MPI_Datatype), INTENT(IN) :: {self.name}(*)'
-        else:
-            return f'INTEGER, INTENT(IN) :: {self.name}(*)'
+        return self._declare + self.name + '(*)'
 
     def use(self):
-        if self.gen_f90 == False:
-            return [('mpi_f08_types', 'MPI_Datatype')]
-        else:
-            return []
+        return self._use
 
     def c_parameter(self):
-        return f'MPI_Fint *{self.name}'
+        return 'MPI_Fint *' + self.name
+
 
+class IntType(FortranType, type_name='INT'):
+    __slots__ = ()
+    _DECL_PREFIX = 'INTEGER, INTENT(IN) :: '
+    _CPAR_PREFIX = 'MPI_Fint *'
 
-@FortranType.add('INT')
-class IntType(FortranType):
     def declare(self):
-        return f'INTEGER, INTENT(IN) :: {self.name}'
+        return self._DECL_PREFIX + self.name
 
     def c_parameter(self):
-        return f'MPI_Fint *{self.name}'
+        return self._CPAR_PREFIX + self.name
+
+class IntOutType(FortranType, type_name='INT_OUT'):
+    __slots__ = ()
+    _DECL_PREFIX = 'INTEGER, INTENT(OUT) :: '
+    _CPAR_PREFIX = 'MPI_Fint *'
 
-@FortranType.add('INT_OUT')
-class IntOutType(FortranType):
     def declare(self):
-        return f'INTEGER, INTENT(OUT) :: {self.name}'
+        return self._DECL_PREFIX + self.name
 
     def c_parameter(self):
-        return f'MPI_Fint *{self.name}'
+        return self._CPAR_PREFIX + self.name
+
+class IntInOutType(FortranType, type_name='INT_INOUT'):
+    __slots__ = ()
+    _DECL_PREFIX = 'INTEGER, INTENT(INOUT) :: '
+    _CPAR_PREFIX = 'MPI_Fint *'
 
-@FortranType.add('INT_INOUT')
-class IntOutType(FortranType):
     def declare(self):
-        return f'INTEGER, INTENT(INOUT) :: {self.name}'
+        return self._DECL_PREFIX + self.name
 
     def c_parameter(self):
-        return f'MPI_Fint *{self.name}'
+        return self._CPAR_PREFIX + self.name
 
-@FortranType.add('RANK')
-class RankType(IntType):
-    pass
+class RankType(IntType, type_name='RANK'):
+    __slots__ = ()
 
-@FortranType.add('RANK_OUT')
-class RankType(IntOutType):
-    pass
+class RankOutType(IntOutType, type_name='RANK_OUT'):
+    __slots__ = ()
 
-@FortranType.add('TAG')
-class TagType(IntType):
-    pass
+class TagType(IntType, type_name='TAG'):
+    __slots__ = ()
 
 
-@FortranType.add('INDEX_OUT')
-class IndexOutType(IntType):
-    def declare(self):
-        return f'INTEGER, INTENT(OUT) :: {self.name}'
+class IndexOutType(IntType, type_name='INDEX_OUT'):
+    __slots__ = ()
+    _DECL_PREFIX = 'INTEGER, INTENT(OUT) :: '
 
 
-@FortranType.add('LOGICAL')
-class LogicalType(IntType):
+class LogicalType(IntType, type_name='LOGICAL'):
     """Logical type.
 
     NOTE: Since the logical type causes difficulties when passed to C code,
     this code uses a temporary integer in Fortran to pass to the C code. The 
     logical type is set based on C's true/false rules prior.
-    """ 
-        
+    """
+    __slots__ = ('_tmp_decl', '_pre_c_call')
+    HAS_TMP_DECL = True
+    HAS_PRE_C_CALL = True
+
+    def _bind_variants(self):
+        # The conversion strings only depend on the parameter name, so
+        # build them once at construction time.
+        self._tmp_decl = 'INTEGER :: ' + self.tmp_name + ' = 0'
+        self._pre_c_call = self.tmp_name + ' = merge(1,0,' + self.name + ')'
+
     def declare(self):
-        return f'LOGICAL, INTENT(IN) :: {self.name}'
-            
+        return 'LOGICAL, INTENT(IN) :: ' + self.name
+
     def declare_tmp(self):
-        return f'INTEGER :: {self.tmp_name} = 0'
-    
+        return self._tmp_decl
+
     def declare_cbinding_fortran(self):
-        return f'INTEGER, INTENT(IN) :: {self.name}'
+        return 'INTEGER, INTENT(IN) :: ' + self.name
 
     def argument(self):
         return self.tmp_name
-        
+
     def pre_c_call(self):
-        return f'{self.tmp_name} = merge(1,0,{self.name})'
-    
+        return self._pre_c_call
+
     def c_parameter(self):
-        return f'MPI_Fint *{self.name}'
+        return 'MPI_Fint *' + self.name
 
-@FortranType.add('LOGICAL_ARRAY')
-class LogicalArrayType(IntType):
+class LogicalArrayType(IntType, type_name='LOGICAL_ARRAY'):
     """Logical array type.
 
     NOTE: Since the logical type causes difficulties when passed to C code,
-    this code uses a temporary integer array in Fortran to pass to the C code. The 
-    logical type is set based on C's true/false rules prior using fortran merge intrinsic
-    procedure.
-    """ 
-        
+    this code uses a temporary integer array in Fortran to pass to the C code.
+    The integer array is set from the logical array with a masked (where)
+    assignment, which compilers vectorize better than an elementwise
+    merge() call.
+    """
+    __slots__ = ('_tmp_decl', '_pre_c_call')
+    HAS_TMP_DECL = True
+    HAS_PRE_C_CALL = True
+
+    def _bind_variants(self):
+        self._tmp_decl = f'INTEGER :: {self.tmp_name}({self.count_param})'
+        self._pre_c_call = (f'where ({self.name})\n'
+                            f'    {self.tmp_name} = 1\n'
+                            'elsewhere\n'
+                            f'    {self.tmp_name} = 0\n'
+                            'end where')
+
     def declare(self):
         return f'LOGICAL, INTENT(IN) :: {self.name}({self.count_param})'
-            
+
     def declare_tmp(self):
-        return f'INTEGER :: {self.tmp_name}({self.count_param})'
+        return self._tmp_decl
 
     def declare_cbinding_fortran(self):
         return f'INTEGER, INTENT(IN) :: {self.name}({self.count_param})'
@@ -413,1195 +614,792 @@ class LogicalArrayType(IntType):
         return self.tmp_name
 
     def pre_c_call(self):
-        return f'{self.tmp_name} = merge(1,0,{self.name})'
-    
+        return self._pre_c_call
+
     def c_parameter(self):
-        return f'MPI_Fint *{self.name}'
+        return 'MPI_Fint *' + self.name
 
-@FortranType.add('LOGICAL_OUT')
-class LogicalOutType(IntType):
+class LogicalOutType(IntType, type_name='LOGICAL_OUT'):
     """Logical type.
 
     NOTE: Since the logical type causes difficulties when passed to C code,
     this code uses a temporary integer in Fortran to pass to the C code. On
     completion the logical type is set based on C's true/false rules.
     """
+    __slots__ = ('_tmp_decl', '_post')
+    HAS_TMP_DECL = True
+    HAS_POST = True
+
+    def _bind_variants(self):
+        self._tmp_decl = 'INTEGER :: ' + self.tmp_name + ' = 0'
+        self._post = self.name + ' = (' + self.tmp_name + ' /= 0)'
 
     def declare(self):
-        return f'LOGICAL, INTENT(OUT) :: {self.name}'
+        return 'LOGICAL, INTENT(OUT) :: ' + self.name
 
     def declare_tmp(self):
-        return f'INTEGER :: {self.tmp_name} = 0'
+        return self._tmp_decl
 
     def declare_cbinding_fortran(self):
-        return f'INTEGER, INTENT(OUT) :: {self.name}'
+        return 'INTEGER, INTENT(OUT) :: ' + self.name
 
     def argument(self):
         return self.tmp_name
 
     def post(self):
-        return f'{self.name} = {self.tmp_name} /= 0'
+        return self._post
 
     def c_parameter(self):
-        return f'MPI_Fint *{self.name}'
+        return 'MPI_Fint *' + self.name
 
-@FortranType.add('LOGICAL_ARRAY_OUT')
-class LogicalArrayType(IntType):
+class LogicalArrayOutType(IntType, type_name='LOGICAL_ARRAY_OUT'):
     """Logical array type.
 
     NOTE: Since the logical type causes difficulties when passed to C code,
-    this code uses a temporary integer array in Fortran to pass to the C code. The
-    logical type is set based on C's true/false rules prior using fortran merge intrinsic
-    procedure.
+    this code uses a temporary integer array in Fortran to pass to the C code.
+    On completion the logical array is set from the integer array based on C's
+    true/false rules.
     """
+    __slots__ = ('_tmp_decl', '_post')
+    HAS_TMP_DECL = True
+    HAS_POST = True
+
+    def _bind_variants(self):
+        self._tmp_decl = f'INTEGER :: {self.tmp_name}({self.count_param})'
+        self._post = self.name + ' = (' + self.tmp_name + ' /= 0)'
 
     def declare(self):
         return f'LOGICAL, INTENT(OUT) :: {self.name}({self.count_param})'
 
     def declare_tmp(self):
-        return f'INTEGER :: {self.tmp_name}({self.count_param})'
-    
+        return self._tmp_decl
+
     def declare_cbinding_fortran(self):
         return f'INTEGER, INTENT(OUT) :: {self.name}({self.count_param})'
-        
+
     def argument(self):
         return self.tmp_name
 
-    def pre_c_call(self):
-        return f'{self.tmp_name} = merge(1,0,{self.name})'
-   
+    def post(self):
+        return self._post
+
     def c_parameter(self):
-        return f'MPI_Fint *{self.name}'
-        
-@FortranType.add('COMM')
-class CommType(FortranType):
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'TYPE(MPI_Comm), INTENT(IN) :: {self.name}'
-        else:
-            return f'INTEGER, INTENT(IN) :: {self.name}'
+        return 'MPI_Fint *' + self.name
 
-    def declare_cbinding_fortran(self):
-        return f'INTEGER, INTENT(IN) :: {self.name}'
+class CommType(_FintCBinding, _MPIValArgument, FortranType, type_name='COMM'):
+    __slots__ = ()
+    _INTENT = 'IN'
 
-    def argument(self):
-        return f'{self.name}%MPI_VAL'
+    def _bind_variants(self):
+        if not self.gen_f90:
+            self._declare = f'TYPE(MPI_Comm), INTENT({self._INTENT}) :: '
+            self._use = _USE_COMM
+        else:
+            self._declare = f'INTEGER, INTENT({self._INTENT}) :: '
+            self._use = _USE_EMPTY
+
+    def declare(self):
+        return self._declare + self.name
 
     def use(self):
-        if self.gen_f90 == False:
-            return [('mpi_f08_types', 'MPI_Comm')]
-        else:
-            return []
+        return self._use
 
     def c_parameter(self):
-        return f'MPI_Fint *{self.name}'
+        return 'MPI_Fint *' + self.name
 
-@FortranType.add('COMM_OUT')
-class CommOutType(CommType):
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'TYPE(MPI_Comm), INTENT(OUT) :: {self.name}'
-        else:
-            return f'INTEGER, INTENT(OUT) :: {self.name}'
-    
-    def declare_cbinding_fortran(self):
-        return f'INTEGER, INTENT(OUT) :: {self.name}'
-        
+class CommOutType(CommType, type_name='COMM_OUT'):
+    __slots__ = ()
+    _INTENT = 'OUT'
 
-@FortranType.add('COMM_INOUT')
-class CommInOutType(CommType):
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'TYPE(MPI_Comm), INTENT(INOUT) :: {self.name}'
+class CommInOutType(CommType, type_name='COMM_INOUT'):
+    __slots__ = ()
+    _INTENT = 'INOUT'
+
+
+class GroupType(_FintCBinding, _MPIValArgument, FortranType, type_name='GROUP'):
+    __slots__ = ()
+    _INTENT = 'IN'
+
+    def _bind_variants(self):
+        if not self.gen_f90:
+            self._declare = f'TYPE(MPI_Group), INTENT({self._INTENT}) :: '
+            self._use = _USE_GROUP
         else:
-            return f'INTEGER, INTENT(INOUT) :: {self.name}'
-    
-    def declare_cbinding_fortran(self):
-        return f'INTEGER, INTENT(INOUT) :: {self.name}'
-            
-@FortranType.add('GROUP')
-class GroupType(FortranType):
+            self._declare = f'INTEGER, INTENT({self._INTENT}) :: '
+            self._use = _USE_EMPTY
+
     def declare(self):
-        if self.gen_f90 == False:
-            return f'TYPE(MPI_Group), INTENT(IN) :: {self.name}'
-        else:
-            return f'INTEGER, INTENT(IN) :: {self.name}'
-    
-    def declare_cbinding_fortran(self):
-        return f'INTEGER, INTENT(IN) :: {self.name}'
-            
-    def argument(self):
-        return f'{self.name}%MPI_VAL'
+        return self._declare + self.name
 
     def use(self):
-        if self.gen_f90 == False:
-            return [('mpi_f08_types', 'MPI_Group')]
-        else:
-            return []
-        
+        return self._use
+
     def c_parameter(self):
-        return f'MPI_Fint *{self.name}'
-    
-@FortranType.add('GROUP_OUT')
-class GroupOutType(GroupType):
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'TYPE(MPI_Group), INTENT(OUT) :: {self.name}'
-        else:
-            return f'INTEGER, INTENT(OUT) :: {self.name}'
-    
-    def declare_cbinding_fortran(self):
-        return f'INTEGER, INTENT(OUT) :: {self.name}'
-            
-@FortranType.add('GROUP_INOUT')
-class GroupInOutType(GroupType):
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'TYPE(MPI_Group), INTENT(INOUT) :: {self.name}'
+        return 'MPI_Fint *' + self.name
+
+class GroupOutType(GroupType, type_name='GROUP_OUT'):
+    __slots__ = ()
+    _INTENT = 'OUT'
+
+class GroupInOutType(GroupType, type_name='GROUP_INOUT'):
+    __slots__ = ()
+    _INTENT = 'INOUT'
+
+class SessionType(_FintCBinding, _MPIValArgument, FortranType, type_name='SESSION'):
+    __slots__ = ()
+    _INTENT = 'IN'
+
+    def _bind_variants(self):
+        if not self.gen_f90:
+            self._declare = f'TYPE(MPI_Session), INTENT({self._INTENT}) :: '
+            self._use = _USE_SESSION
         else:
-            return f'INTEGER, INTENT(INOUT) :: {self.name}'
-    
-    def declare_cbinding_fortran(self):
-        return f'INTEGER, INTENT(INOUT) :: {self.name}'
+            self._declare = f'INTEGER, INTENT({self._INTENT}) :: '
+            self._use = _USE_EMPTY
 
-@FortranType.add('SESSION')
-class SessionType(FortranType):
     def declare(self):
-        if self.gen_f90 == False:
-            return f'TYPE(MPI_Session), INTENT(IN) :: {self.name}'
-        else:
-            return f'INTEGER, INTENT(IN) :: {self.name}'
-        
-    def declare_cbinding_fortran(self):
-        return f'INTEGER, INTENT(IN) :: {self.name}'
-    
-    def argument(self):
-        return f'{self.name}%MPI_VAL'
-        
+        return self._declare + self.name
+
     def use(self):
-        if self.gen_f90 == False:
-            return [('mpi_f08_types', 'MPI_Session')]
-        else:
-            return []
-            
+        return self._use
+
     def c_parameter(self):
-        return f'MPI_Fint *{self.name}'
+        return 'MPI_Fint *' + self.name
 
-@FortranType.add('SESSION_OUT')
-class SessionOutType(SessionType):
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'TYPE(MPI_Session), INTENT(OUT) :: {self.name}'
-        else:
-            return f'INTEGER, INTENT(OUT) :: {self.name}'
-        
-    def declare_cbinding_fortran(self):
-        return f'INTEGER, INTENT(OUT) :: {self.name}'
-    
-@FortranType.add('SESSION_INOUT')
-class SessionInOutType(SessionType):
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'TYPE(MPI_Session), INTENT(INOUT) :: {self.name}'
+class SessionOutType(SessionType, type_name='SESSION_OUT'):
+    __slots__ = ()
+    _INTENT = 'OUT'
+
+class SessionInOutType(SessionType, type_name='SESSION_INOUT'):
+    __slots__ = ()
+    _INTENT = 'INOUT'
+
+class StatusType(FortranType, type_name='STATUS'):
+    __slots__ = ()
+    # The base STATUS type is declared without an INTENT
+    _INTENT = ''
+
+    def _bind_variants(self):
+        intent = f', INTENT({self._INTENT})' if self._INTENT else ''
+        if not self.gen_f90:
+            self._declare = f'TYPE(MPI_Status){intent} :: '
+            self._decl_suffix = ''
+            self._use = _USE_STATUS
+            self._include = ''
         else:
-            return f'INTEGER, INTENT(INOUT) :: {self.name}'
-        
-    def declare_cbinding_fortran(self):
-        return f'INTEGER, INTENT(INOUT) :: {self.name}'
-    
-@FortranType.add('STATUS')
-class StatusType(FortranType):
+            self._declare = f'INTEGER{intent} :: '
+            self._decl_suffix = '(MPI_STATUS_SIZE)'
+            self._use = _USE_EMPTY
+            self._include = _MPIF_CONFIG_INCLUDE
+
     def declare(self):
-        if self.gen_f90 == False:
-            return f'TYPE(MPI_Status) :: {self.name}'
-        else:
-            return f'INTEGER :: {self.name}(MPI_STATUS_SIZE)'
+        return self._declare + self.name + self._decl_suffix
 
     def use(self):
-        if self.gen_f90 == False:
-            return [('mpi_f08_types', 'MPI_Status')]
-        else:
-            return []
+        return self._use
 
     def include(self):
-        if self.gen_f90 == False:
-            return ''
-        else:
-            return f"mpif-config.h"
+        return self._include
 
     def c_parameter(self):
-        return f'MPI_Fint *{self.name}'
+        # TODO: Is this correct? (I've listed it as TYPE(MPI_Status) in the binding)
+        return 'MPI_Fint *' + self.name
 
 
-@FortranType.add('STATUS_OUT')
-class StatusOutType(StatusType):
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'TYPE(MPI_Status), INTENT(OUT) :: {self.name}'
-        else:
-            return f'INTEGER, INTENT(OUT) :: {self.name}(MPI_STATUS_SIZE)'
+class StatusOutType(StatusType, type_name='STATUS_OUT'):
+    __slots__ = ()
+    _INTENT = 'OUT'
 
-    def c_parameter(self):
-        # TODO: Is this correct? (I've listed it as TYPE(MPI_Status) in the binding)
-        return f'MPI_Fint *{self.name}'
+class StatusInOutType(StatusType, type_name='STATUS_INOUT'):
+    __slots__ = ()
+    _INTENT = 'INOUT'
 
-@FortranType.add('STATUS_INOUT')
-class StatusInOutType(StatusType):
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'TYPE(MPI_Status), INTENT(INOUT) :: {self.name}'
-        else:
-            return f'INTEGER, INTENT(INOUT) :: {self.name}(MPI_STATUS_SIZE)'
+class RequestType(_FintCBinding, FortranType, type_name='REQUEST'):
+    __slots__ = ()
+    _INTENT = 'IN'
 
-    def c_parameter(self):
-        # TODO: Is this correct? (I've listed it as TYPE(MPI_Status) in the binding)
-        return f'MPI_Fint *{self.name}'
-
-@FortranType.add('REQUEST')
-class RequestType(FortranType):
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'TYPE(MPI_Request), INTENT(IN) :: {self.name}'
+    def _bind_variants(self):
+        if not self.gen_f90:
+            self._declare = f'TYPE(MPI_Request), INTENT({self._INTENT}) :: '
+            self._argument = self.name + '%MPI_VAL'
+            self._use = _USE_REQUEST
         else:
-            return f'INTEGER, INTENT(IN) :: {self.name}'
+            self._declare = f'INTEGER, INTENT({self._INTENT}) :: '
+            self._argument = self.name
+            self._use = _USE_EMPTY
 
-    def declare_cbinding_fortran(self):
-        return f'INTEGER, INTENT(IN) :: {self.name}'
+    def declare(self):
+        return self._declare + self.name
 
     def argument(self):
-        if self.gen_f90 == False:
-            return f'{self.name}%MPI_VAL'
-        else:
-            return f'{self.name}'
+        return self._argument
 
     def use(self):
-        if self.gen_f90 == False:
-            return [('mpi_f08_types', 'MPI_Request')]
-        else:
-            return []
+        return self._use
 
     def c_parameter(self):
-        return f'MPI_Fint *{self.name}'
+        return 'MPI_Fint *' + self.name
 
-@FortranType.add('REQUEST_OUT')
-class RequestTypeOut(RequestType):
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'TYPE(MPI_Request), INTENT(OUT) :: {self.name}'
-        else:
-            return f'INTEGER, INTENT(OUT) :: {self.name}'
+class RequestTypeOut(RequestType, type_name='REQUEST_OUT'):
+    __slots__ = ()
+    _INTENT = 'OUT'
 
-    def declare_cbinding_fortran(self):
-        return f'INTEGER, INTENT(OUT) :: {self.name}'
+class RequestTypeInOut(RequestType, type_name='REQUEST_INOUT'):
+    __slots__ = ()
+    _INTENT = 'INOUT'
 
-@FortranType.add('REQUEST_INOUT')
-class RequestTypeInOut(RequestType):
     def declare(self):
-        return f'TYPE(MPI_Request), INTENT(INOUT) :: {self.name}'
-        
-    def declare_cbinding_fortran(self):
-        return f'INTEGER, INTENT(INOUT) :: {self.name}'
+        # Declared with the f08 handle type for both interfaces.
+        return 'TYPE(MPI_Request), INTENT(INOUT) :: ' + self.name
 
 
-@FortranType.add('REQUEST_ARRAY')
-class RequestArrayType(FortranType):
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'TYPE(MPI_Request), INTENT(IN) :: {self.name}({self.count_param})'
+class RequestArrayType(FortranType, type_name='REQUEST_ARRAY'):
+    __slots__ = ()
+
+    def _bind_variants(self):
+        if not self.gen_f90:
+            self._declare = 'TYPE(MPI_Request), INTENT(IN) :: '
+            self._decl_suffix = f'({self.count_param})'
+            self._argument = self.name + '(:)%MPI_VAL'
+            self._use = _USE_REQUEST
         else:
-            return f'INTEGER, INTENT(IN) :: {self.name}(*)'
+            self._declare = 'INTEGER, INTENT(IN) :: '
+            self._decl_suffix = '(*)'
+            self._argument = self.name
+            self._use = _USE_EMPTY
+
+    def declare(self):
+        return self._declare + self.name + self._decl_suffix
 
     def declare_cbinding_fortran(self):
-        if self.gen_f90 == False:
-            return f'INTEGER, INTENT(IN) :: {self.name}({self.count_param})'
-        else:
-            return f'INTEGER, INTENT(IN) :: {self.name}(*)'
-   
+        return 'INTEGER, INTENT(IN) :: ' + self.name + self._decl_suffix
+
     def argument(self):
-        if self.gen_f90 == False:
-            return f'{self.name}(:)%MPI_VAL'
-        else:
-            return f'{self.name}'
+        return self._argument
 
     def use(self):
-        if self.gen_f90 == False:
-            return [('mpi_f08_types', 'MPI_Request')]
-        else:
-            return []
+        return self._use
 
     def c_parameter(self):
-        return f'MPI_Fint *{self.name}'
+        return 'MPI_Fint *' + self.name
 
-@FortranType.add('REQUEST_ARRAY_INOUT')
-class RequestArrayTypeInOut(RequestArrayType):
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'TYPE(MPI_Request), INTENT(INOUT) :: {self.name}({self.count_param})'
-        else:
-            return f'TYPE(MPI_Request), INTENT(INOUT) :: {self.name}(*)'
+class RequestArrayTypeInOut(RequestArrayType, type_name='REQUEST_ARRAY_INOUT'):
+    __slots__ = ()
+
+    def _bind_variants(self):
+        super()._bind_variants()
+        # Declared with the f08 handle type for both interfaces.
+        self._declare = 'TYPE(MPI_Request), INTENT(INOUT) :: '
 
     def declare_cbinding_fortran(self):
-        if self.gen_f90 == False:
-            return f'INTEGER, INTENT(INOUT) :: {self.name}({self.count_param})'
+        return 'INTEGER, INTENT(INOUT) :: ' + self.name + self._decl_suffix
+
+class StatusArrayType(FortranType, type_name='STATUS_ARRAY'):
+    __slots__ = ()
+
+    def _bind_variants(self):
+        if not self.gen_f90:
+            self._declare = 'TYPE(MPI_Status), INTENT(OUT) :: '
+            self._decl_suffix = '(*)'
+            self._use = _USE_STATUS
+            self._include = ''
         else:
-            return f'INTEGER, INTENT(INOUT) :: {self.name}(*)'
+            self._declare = 'INTEGER, INTENT(OUT) :: '
+            self._decl_suffix = '(MPI_STATUS_SIZE,*)'
+            self._use = _USE_EMPTY
+            self._include = _MPIF_CONFIG_INCLUDE
 
-@FortranType.add('STATUS_ARRAY')
-class StatusArrayType(FortranType):
     def declare(self):
-        if self.gen_f90 == False:
-            return f'TYPE(MPI_Status), INTENT(OUT) :: {self.name}(*)'
-        else:
-            return f'INTEGER, INTENT(OUT) :: {self.name}(MPI_STATUS_SIZE,*)'
+        return self._declare + self.name + self._decl_suffix
 
     def use(self):
-        if self.gen_f90 == False:
-            return [('mpi_f08_types', 'MPI_Status')]
-        else:
-            return []
+        return self._use
 
     def include(self):
-        if self.gen_f90 == False:
-            return ''
-        else:
-            return f"mpif-config.h"
+        return self._include
 
     def c_parameter(self):
-        return f'MPI_Fint *{self.name}'
+        return 'MPI_Fint *' + self.name
 
-@FortranType.add('INT_ARRAY')
-class IntArray(FortranType):
+class IntArray(FortranType, type_name='INT_ARRAY'):
     """Integer array as used for MPI_*v() variable length functions."""
+    __slots__ = ()
+    _INTENT = 'IN'
+
+    def _bind_variants(self):
+        size = '*' if self.count_param is None else self.count_param
+        self._declare = f'INTEGER, INTENT({self._INTENT}) :: '
+        self._decl_suffix = f'({size})'
+        self._use = _USE_STATUS_SIZE if self.count_param == 'MPI_STATUS_SIZE' else ()
 
     def declare(self):
-        size = '*' if self.count_param == None else self.count_param
-        return f'INTEGER, INTENT(IN) :: {self.name}({size})'
+        return self._declare + self.name + self._decl_suffix
 
     def use(self):
-        if self.count_param == 'MPI_STATUS_SIZE':
-            return [('mpi_f08_types', 'MPI_STATUS_SIZE')]
-        else:
-            return []
+        return self._use
 
     def c_parameter(self):
-        return f'MPI_Fint *{self.name}'
+        return 'MPI_Fint *' + self.name
 
-@FortranType.add('INT_ARRAY_OUT')
-class IntArrayOut(IntArray):
+class IntArrayOut(IntArray, type_name='INT_ARRAY_OUT'):
     """Integer out array as used for MPI_*v() variable length functions."""
+    __slots__ = ()
+    _INTENT = 'OUT'
 
-    def declare(self):
-        size = '*' if self.count_param == None else self.count_param
-        return f'INTEGER, INTENT(OUT) :: {self.name}({size})'
-        
-    def c_parameter(self):
-        return f'MPI_Fint *{self.name}'
-
-@FortranType.add('INT_ARRAY_INOUT')
-class IntArrayInOut(IntArray):
+class IntArrayInOut(IntArray, type_name='INT_ARRAY_INOUT'):
     """Integer out array as used for MPI_*v() variable length functions."""
-        
-    def declare(self):
-        size = '*' if self.count_param == None else self.count_param
-        return f'INTEGER, INTENT(INOUT) :: {self.name}({size})'
-        
-@FortranType.add('COUNT_ARRAY')
-class CountArray(IntArray):
+    __slots__ = ()
+    _INTENT = 'INOUT'
+
+class CountArray(IntArray, type_name='COUNT_ARRAY'):
     """Array of MPI_Count or int."""
+    __slots__ = ()
 
-    def declare(self):
+    def _bind_variants(self):
         kind = '(KIND=MPI_COUNT_KIND)' if self.bigcount else ''
-        size = '*' if self.count_param == None else self.count_param
-#       print("size " + size + "count_param" + str(self.count_param))
-        return f'INTEGER{kind}, INTENT(IN) :: {self.name}({size})'
-
-    def use(self):
-        if self.bigcount:
-            return [('mpi_f08_types', 'MPI_COUNT_KIND')]
-        return []
+        size = '*' if self.count_param is None else self.count_param
+        self._declare = f'INTEGER{kind}, INTENT(IN) :: '
+        self._decl_suffix = f'({size})'
+        self._use = _USE_COUNT_KIND if self.bigcount else ()
+        self._cpar = 'MPI_Count *' if self.bigcount else 'MPI_Fint *'
 
     def c_parameter(self):
-        count_type = 'MPI_Count' if self.bigcount else 'MPI_Fint'
-        return f'{count_type} *{self.name}'
+        return self._cpar + self.name
 
-@FortranType.add('AINT_COUNT_ARRAY')
-class CountArray(IntArray):
+class AintCountArrayType(IntArray, type_name='AINT_COUNT_ARRAY'):
     """Array of MPI_Count or int."""
+    __slots__ = ()
 
-    def declare(self):
+    def _bind_variants(self):
         kind = '(KIND=MPI_COUNT_KIND)' if self.bigcount else '(KIND=MPI_ADDRESS_KIND)'
-        size = '*' if self.count_param == None else self.count_param
-        return f'INTEGER{kind}, INTENT(IN) :: {self.name}({size})'
-
-    def use(self):
-        if self.bigcount:
-            return [('mpi_f08_types', 'MPI_COUNT_KIND')]
-        else:
-            return [('mpi_f08_types', 'MPI_ADDRESS_KIND')]
+        size = '*' if self.count_param is None else self.count_param
+        self._declare = f'INTEGER{kind}, INTENT(IN) :: '
+        self._decl_suffix = f'({size})'
+        self._use = _USE_COUNT_KIND if self.bigcount else _USE_ADDRESS_KIND
+        self._include = '' if not self.gen_f90 else _MPIF_CONFIG_INCLUDE
+        self._cpar = 'MPI_Count *' if self.bigcount else 'MPI_Aint *'
 
     def include(self):
-        if self.gen_f90 == False:
-            return ''
-        else:
-            return f"mpif-config.h"
+        return self._include
 
     def c_parameter(self):
-        count_type = 'MPI_Count' if self.bigcount else 'MPI_Aint'
-        return f'{count_type} *{self.name}'
+        return self._cpar + self.name
 
 
 
-@FortranType.add('AINT')
-class Aint(FortranType):
+class Aint(FortranType, type_name='AINT'):
     """MPI_Aint type."""
+    __slots__ = ()
+    _INTENT = 'IN'
+
+    def _bind_variants(self):
+        self._use = _USE_ADDRESS_KIND if not self.gen_f90 else ()
+        self._include = '' if not self.gen_f90 else _MPIF_CONFIG_INCLUDE
 
     def declare(self):
-        return f'INTEGER(MPI_ADDRESS_KIND), INTENT(IN) :: {self.name}'
+        return f'INTEGER(MPI_ADDRESS_KIND), INTENT({self._INTENT}) :: ' + self.name
 
     def use(self):
-        if self.gen_f90 == False:
-            return [('mpi_f08_types', 'MPI_ADDRESS_KIND')]
-        else:
-            return []
+        return self._use
 
     def include(self):
-        if self.gen_f90 == False:
-            return ''
-        else:
-            return "mpif-config.h"
+        return self._include
 
     def c_parameter(self):
-        return f'MPI_Aint *{self.name}'
+        return 'MPI_Aint *' + self.name
 
 
-@FortranType.add('AINT_OUT')
-class AintOut(Aint):
+class AintOut(Aint, type_name='AINT_OUT'):
     """MPI_Aint out type."""
-
-    def declare(self):
-        return f'INTEGER(MPI_ADDRESS_KIND), INTENT(OUT) :: {self.name}'
+    __slots__ = ()
+    _INTENT = 'OUT'
 
 
-@FortranType.add('AINT_COUNT')
-class AintCountTypeIn(FortranType):
+class AintCountTypeIn(FortranType, type_name='AINT_COUNT'):
     """AINT/COUNT type with ININTENT"""
-    def declare(self):
+    __slots__ = ()
+    _INTENT = 'IN'
+
+    def _bind_variants(self):
         if self.bigcount:
-            return f'INTEGER(KIND=MPI_COUNT_KIND), INTENT(IN) :: {self.name}'
+            self._declare = f'INTEGER(KIND=MPI_COUNT_KIND), INTENT({self._INTENT}) :: '
+            self._use = _USE_COUNT_KIND
+            self._cpar = 'MPI_Count *'
         else:
-            return f'INTEGER(KIND=MPI_ADDRESS_KIND), INTENT(IN) :: {self.name}'
+            self._declare = f'INTEGER(KIND=MPI_ADDRESS_KIND), INTENT({self._INTENT}) :: '
+            self._use = _USE_ADDRESS_KIND if not self.gen_f90 else _USE_EMPTY
+            self._cpar = 'MPI_Aint *'
+        self._include = '' if not self.gen_f90 else _MPIF_CONFIG_INCLUDE
+
+    def declare(self):
+        return self._declare + self.name
 
     def use(self):
-        if self.bigcount:
-            return [('mpi_f08_types', 'MPI_COUNT_KIND')]
-        else:
-            if self.gen_f90 == False:
-                return [('mpi_f08_types', 'MPI_ADDRESS_KIND')]
-            else:
-                return []
+        return self._use
 
     def include(self):
-        if self.gen_f90 == False:
-            return ''
-        else:
-            return "mpif-config.h"
+        return self._include
 
     def c_parameter(self):
-        type_ = 'MPI_Count' if self.bigcount else 'MPI_Aint'
-        return f'{type_} *{self.name}'
+        return self._cpar + self.name
 
 
-@FortranType.add('AINT_COUNT_INOUT')
-class AintCountTypeInOut(FortranType):
+class AintCountTypeInOut(AintCountTypeIn, type_name='AINT_COUNT_INOUT'):
     """AINT/COUNT type with INOUT INTENT"""
-    def declare(self):
-        if self.bigcount:
-            return f'INTEGER(KIND=MPI_COUNT_KIND), INTENT(INOUT) :: {self.name}'
-        else:
-            return f'INTEGER(KIND=MPI_ADDRESS_KIND), INTENT(INOUT) :: {self.name}'
-
-    def use(self):
-        if self.bigcount:
-            return [('mpi_f08_types', 'MPI_COUNT_KIND')]
-        else:
-            return [('mpi_f08_types', 'MPI_ADDRESS_KIND')]
+    __slots__ = ()
+    _INTENT = 'INOUT'
 
-    def c_parameter(self):
-        type_ = 'MPI_Count' if self.bigcount else 'MPI_Aint'
-        return f'{type_} *{self.name}'
+    def _bind_variants(self):
+        super()._bind_variants()
+        # Unlike the IN variant, the non-bigcount in/out types always pull
+        # in the address-kind constant and never emit the f90 include.
+        if not self.bigcount:
+            self._use = _USE_ADDRESS_KIND
+        self._include = ''
 
 
-@FortranType.add('AINT_COUNT_OUT')
-class AintCountTypeOut(FortranType):
+class AintCountTypeOut(AintCountTypeInOut, type_name='AINT_COUNT_OUT'):
     """AINT/COUNT type with OUT INTENT"""
-    def declare(self):
-        if self.bigcount:
-            return f'INTEGER(KIND=MPI_COUNT_KIND), INTENT(OUT) :: {self.name}'
-        else:
-            return f'INTEGER(KIND=MPI_ADDRESS_KIND), INTENT(OUT) :: {self.name}'
-
-    def use(self):
-        if self.bigcount:
-            return [('mpi_f08_types', 'MPI_COUNT_KIND')]
-        else:
-            return [('mpi_f08_types', 'MPI_ADDRESS_KIND')]
-
-    def c_parameter(self):
-        type_ = 'MPI_Count' if self.bigcount else 'MPI_Aint'
-        return f'{type_} *{self.name}'
+    __slots__ = ()
+    _INTENT = 'OUT'
 
 
-@FortranType.add('AINT_ARRAY')
-class AintArrayType(FortranType):
+class AintArrayType(FortranType, type_name='AINT_ARRAY'):
     """Array of MPI_Aint."""
+    __slots__ = ()
+
+    def _bind_variants(self):
+        size = '*' if self.count_param is None else self.count_param
+        self._decl_suffix = f'({size})'
 
     def declare(self):
         # TODO: Should there be a separate ASYNC version here, when the OMPI_ASYNCHRONOUS attr is required?
-        size = '*' if self.count_param == None else self.count_param
-        return f'INTEGER(KIND=MPI_ADDRESS_KIND), INTENT(IN) OMPI_ASYNCHRONOUS :: {self.name}({size})'
+        return 'INTEGER(KIND=MPI_ADDRESS_KIND), INTENT(IN) OMPI_ASYNCHRONOUS :: ' + self.name + self._decl_suffix
 
     def use(self):
-        return [('mpi_f08_types', 'MPI_ADDRESS_KIND')]
+        return _USE_ADDRESS_KIND
 
     def c_parameter(self):
-        return f'MPI_Aint *{self.name}'
+        return 'MPI_Aint *' + self.name
 
 
-@FortranType.add('DISP')
-class Disp(FortranType):
+class Disp(FortranType, type_name='DISP'):
     """Displacecment type."""
+    __slots__ = ()
+    _INTENT = 'IN'
 
-    def declare(self):
+    def _bind_variants(self):
         kind = '(KIND=MPI_ADDRESS_KIND)' if self.bigcount else ''
-        return f'INTEGER{kind}, INTENT(IN) :: {self.name}'
-
-    def use(self):
-        if self.bigcount:
-            return [('mpi_f08_types', 'MPI_ADDRESS_KIND')]
-        return []
-
-    def c_parameter(self):
-        count_type = 'MPI_Aint' if self.bigcount else 'MPI_Fint'
-        return f'{count_type} *{self.name}'
-
-@FortranType.add('DISP_OUT')
-class DispOut(FortranType):
-    """Displacecment out type."""
+        self._declare = f'INTEGER{kind}, INTENT({self._INTENT}) :: '
+        self._use = _USE_ADDRESS_KIND if self.bigcount else ()
+        self._cpar = 'MPI_Aint *' if self.bigcount else 'MPI_Fint *'
 
     def declare(self):
-        kind = '(KIND=MPI_ADDRESS_KIND)' if self.bigcount else ''
-        return f'INTEGER{kind}, INTENT(OUT) :: {self.name}'
+        return self._declare + self.name
 
     def use(self):
-        if self.bigcount:
-            return [('mpi_f08_types', 'MPI_ADDRESS_KIND')]
-        return []
+        return self._use
 
     def c_parameter(self):
-        count_type = 'MPI_Aint' if self.bigcount else 'MPI_Fint'
-        return f'{count_type} *{self.name}'
+        return self._cpar + self.name
+
+class DispOut(Disp, type_name='DISP_OUT'):
+    """Displacecment out type."""
+    __slots__ = ()
+    _INTENT = 'OUT'
 
 
-@FortranType.add('DISP_ARRAY')
-class DispArray(IntArray):
+class DispArray(IntArray, type_name='DISP_ARRAY'):
     """Array of MPI_Aint or int."""
+    __slots__ = ()
 
-    def declare(self):
+    def _bind_variants(self):
         kind = '(KIND=MPI_ADDRESS_KIND)' if self.bigcount else ''
-        size = '*' if self.count_param == None else self.count_param
-        return f'INTEGER{kind}, INTENT(IN) :: {self.name}({size})'
-
-    def use(self):
-        if self.bigcount:
-            return [('mpi_f08_types', 'MPI_ADDRESS_KIND')]
-        return []
+        size = '*' if self.count_param is None else self.count_param
+        self._declare = f'INTEGER{kind}, INTENT(IN) :: '
+        self._decl_suffix = f'({size})'
+        self._use = _USE_ADDRESS_KIND if self.bigcount else ()
+        self._cpar = 'MPI_Aint *' if self.bigcount else 'MPI_Fint *'
 
     def c_parameter(self):
-        count_type = 'MPI_Aint' if self.bigcount else 'MPI_Fint'
-        return f'{count_type} *{self.name}'
+        return self._cpar + self.name
 
 
-@FortranType.add('OP')
-class Op(FortranType):
-    """MPI_Op type."""
+def _template_attrs(template_cls):
+    """Copy a template class's namespace for a flattened concrete class.
 
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'TYPE(MPI_Op), INTENT(IN) :: {self.name}'
-        else:
-            return f'INTEGER, INTENT(IN) :: {self.name}'
+    The generated handle and callback classes subclass FortranType
+    directly and carry the template's methods themselves, keeping the
+    MRO one level deep for the hot method lookups.
+    """
+    skip = set(template_cls.__slots__)
+    return {key: value for key, value in vars(template_cls).items()
+            if not key.startswith('__') and key not in skip}
 
-    def declare_cbinding_fortran(self):
-        return f'INTEGER, INTENT(IN) :: {self.name}'
 
-    def use(self):
-        if self.gen_f90 == False:
-            return [('mpi_f08_types', 'MPI_Op')]
-        else:
-            return []
+class HandleType(FortranType):
+    """Generic MPI handle type.
 
-    def argument(self):
-        if self.gen_f90 == False:
-            return f'{self.name}%MPI_VAL'
-        else:
-            return f'{self.name}'
-
-    def c_parameter(self):
-        return f'MPI_Fint *{self.name}'
+    The concrete handle types (MPI_Op, MPI_Win, MPI_File, ...) differ only
+    in the handle name, the declared INTENT, the INTENT used in the C
+    binding declaration and whether the f08 argument passes %MPI_VAL; they
+    are generated from _HANDLE_TABLE below.
+    """
+    __slots__ = ()
+    # All of these are computed once per class by _make_handle_type so the
+    # per-instance and per-call paths are pure concatenation.
+    _HAS_MPI_VAL = True
+    _USE_F08 = ()
+    _DECL_F08 = None
+    _DECL_F90 = None
+    # Prefix of the INTEGER C-binding declaration; None falls back to declare()
+    _CB_DECL = None
 
-@FortranType.add('OP_INOUT')
-class OpInOut(Op):
-    """MPI_Op INOUT type."""
-    
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'TYPE(MPI_Op), INTENT(INOUT) :: {self.name}'
+    def _bind_variants(self):
+        if not self.gen_f90:
+            self._declare = self._DECL_F08
+            self._argument = self.name + '%MPI_VAL' if self._HAS_MPI_VAL else self.name
+            self._use = self._USE_F08
         else:
-            return f'INTEGER, INTENT(INOUT) :: {self.name}'
-    
-@FortranType.add('WIN')
-class Win(FortranType):
-    """MPI_Win type."""
+            self._declare = self._DECL_F90
+            self._argument = self.name
+            self._use = _USE_EMPTY
 
     def declare(self):
-        if self.gen_f90 == False:
-            return f'TYPE(MPI_Win), INTENT(IN) :: {self.name}'
-        else:
-            return f'INTEGER, INTENT(IN) :: {self.name}'
+        return self._declare + self.name
 
     def declare_cbinding_fortran(self):
-        return f'INTEGER, INTENT(IN) :: {self.name}'
-
-    def use(self):
-        if self.gen_f90 == False:
-            return [('mpi_f08_types', 'MPI_Win')]
-        else:
-            return []
+        if self._CB_DECL is None:
+            return self.declare()
+        return self._CB_DECL + self.name
 
     def argument(self):
-        if self.gen_f90 == False:
-            return f'{self.name}%MPI_VAL'
-        else:
-            return f'{self.name}'
-
-    def c_parameter(self):
-        return f'MPI_Fint *{self.name}'
-
-@FortranType.add('WIN_OUT')
-class WinOut(Win):
-    """MPI_Win out type."""
-
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'TYPE(MPI_Win), INTENT(OUT) :: {self.name}'
-        else:
-            return f'INTEGER, INTENT(OUT) :: {self.name}'
-
-    def declare_cbinding_fortran(self):
-        return f'INTEGER, INTENT(OUT) :: {self.name}'
-
-@FortranType.add('WIN_INOUT')
-class WinInOut(Win):
-    """MPI_Win inout type."""
-
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'TYPE(MPI_Win), INTENT(INOUT) :: {self.name}'
-        else:
-            return f'INTEGER, INTENT(INOUT) :: {self.name}'
-
-    def declare_cbinding_fortran(self):
-        return f'INTEGER, INTENT(INOUT) :: {self.name}'
-
-@FortranType.add('FILE')
-class File(FortranType):
-    """MPI_File type."""
-
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'TYPE(MPI_File), INTENT(IN) :: {self.name}'
-        else:
-            return f'INTEGER, INTENT(IN) :: {self.name}'
-
-    def use(self):
-        if self.gen_f90 == False:
-            return [('mpi_f08_types', 'MPI_File')]
-        else:
-            return []
-
-    def c_parameter(self):
-        return f'MPI_Fint *{self.name}'
-
-@FortranType.add('FILE_OUT')
-class FileOut(File):
-    """MPI_File OUT type."""
-        
-    def declare(self):
-        if self.gen_f90 == False:
-           return f'TYPE(MPI_File), INTENT(OUT) :: {self.name}'
-        else:
-           return f'INTEGER, INTENT(OUT) :: {self.name}'
-
-    def declare_cbinding_fortran(self):
-        return f'INTEGER, INTENT(OUT) :: {self.name}'
-
-@FortranType.add('INFO')
-class Info(FortranType):
-    """MPI_Info type."""
-
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'TYPE(MPI_Info), INTENT(IN) :: {self.name}'
-        else:
-            return f'INTEGER, INTENT(IN) :: {self.name}'
+        return self._argument
 
     def use(self):
-        if self.gen_f90 == False:
-            return [('mpi_f08_types', 'MPI_Info')]
-        else:
-            return []
+        return self._use
 
     def c_parameter(self):
-        return f'MPI_Fint *{self.name}'
-
-@FortranType.add('INFO_OUT')
-class InfoOut(Info):
-    """MPI_Info out type."""
-
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'TYPE(MPI_Info), INTENT(OUT) :: {self.name}'
-        else:
-            return f'INTEGER, INTENT(OUT) :: {self.name}'
-
-@FortranType.add('INFO_INOUT')
-class InfoInOut(Info):
-    """MPI_Info inout type."""
+        return 'MPI_Fint *' + self.name
+
+
+# tag -> (handle type, declared INTENT, C-binding INTENT or None, pass %MPI_VAL).
+# The None/False combinations preserve the behavior of the classes this table
+# replaced: FILE/INFO/MESSAGE never overrode the C-binding declaration or the
+# argument, and OP_INOUT kept the IN C-binding of OP.
+_HANDLE_TABLE = {
+    'OP': ('MPI_Op', 'IN', 'IN', True),
+    'OP_INOUT': ('MPI_Op', 'INOUT', 'IN', True),
+    'WIN': ('MPI_Win', 'IN', 'IN', True),
+    'WIN_OUT': ('MPI_Win', 'OUT', 'OUT', True),
+    'WIN_INOUT': ('MPI_Win', 'INOUT', 'INOUT', True),
+    'FILE': ('MPI_File', 'IN', None, False),
+    'FILE_OUT': ('MPI_File', 'OUT', 'OUT', False),
+    'INFO': ('MPI_Info', 'IN', None, False),
+    'INFO_OUT': ('MPI_Info', 'OUT', None, False),
+    'INFO_INOUT': ('MPI_Info', 'INOUT', None, False),
+    'MESSAGE_OUT': ('MPI_Message', 'OUT', None, False),
+    'MESSAGE_INOUT': ('MPI_Message', 'INOUT', None, False),
+    'ERRHANDLER': ('MPI_Errhandler', 'IN', 'IN', True),
+    'ERRHANDLER_OUT': ('MPI_Errhandler', 'OUT', 'OUT', True),
+    'ERRHANDLER_INOUT': ('MPI_Errhandler', 'INOUT', 'INOUT', True),
+}
+
+
+def _make_handle_type(tag, mpi_type, intent, cb_intent, has_mpi_val):
+    """Create one concrete handle class from a _HANDLE_TABLE entry."""
+    name = ''.join(part.capitalize() for part in tag.split('_')) + 'Type'
+    attrs = _template_attrs(HandleType)
+    attrs.update({
+        '__doc__': f'{mpi_type} handle type, INTENT({intent}).',
+        '__slots__': (),
+        '_DECL_F08': f'TYPE({mpi_type}), INTENT({intent}) :: ',
+        '_DECL_F90': f'INTEGER, INTENT({intent}) :: ',
+        '_CB_DECL': None if cb_intent is None else f'INTEGER, INTENT({cb_intent}) :: ',
+        '_HAS_MPI_VAL': has_mpi_val,
+        '_USE_F08': _use(('mpi_f08_types', mpi_type)),
+    })
+    return type(name, (FortranType,), attrs)
+
+
+for _tag, _entry in _HANDLE_TABLE.items():
+    FortranType.register(_tag, _make_handle_type(_tag, *_entry))
+
+
+class Offset(FortranType, type_name='OFFSET'):
+    """MPI_Offset type."""
+    __slots__ = ()
+    _INTENT = 'IN'
 
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'TYPE(MPI_Info), INTENT(INOUT) :: {self.name}'
+    def _bind_variants(self):
+        self._declare = f'INTEGER(MPI_OFFSET_KIND), INTENT({self._INTENT}) :: '
+        if not self.gen_f90:
+            self._use = _USE_OFFSET_KIND
+            self._include = ''
         else:
-            return f'INTEGER, INTENT(INOUT) :: {self.name}'
-
-@FortranType.add('OFFSET')
-class Offset(FortranType):
-    """MPI_Offset type."""
+            self._use = _USE_EMPTY
+            self._include = _MPIF_CONFIG_INCLUDE
 
     def declare(self):
-        return f'INTEGER(MPI_OFFSET_KIND), INTENT(IN) :: {self.name}'
+        return self._declare + self.name
 
     def use(self):
-        if self.gen_f90 == False:
-            return [('mpi_f08_types', 'MPI_OFFSET_KIND')]
-        else:
-            return []
+        return self._use
 
     def include(self):
-        if self.gen_f90 == False:
-            return ''
-        else:
-            return "mpif-config.h"
+        return self._include
 
     def c_parameter(self):
-        return f'MPI_Offset *{self.name}'
+        return 'MPI_Offset *' + self.name
 
-@FortranType.add('OFFSET_OUT')
-class OffsetOut(Offset):
+class OffsetOut(Offset, type_name='OFFSET_OUT'):
     """MPI_Offset OUT type."""
-    
-    def declare(self):
-        return f'INTEGER(MPI_OFFSET_KIND), INTENT(OUT) :: {self.name}'
-        
+    __slots__ = ()
+    _INTENT = 'OUT'
+
 
-@FortranType.add('CHAR_ARRAY')
-class CharArray(FortranType):
+class CharArray(FortranType, type_name='CHAR_ARRAY'):
     """Fortran CHAR type."""
+    __slots__ = ()
 
     def declare(self):
-        return f'CHARACTER(LEN=*), INTENT(IN) :: {self.name}'
+        return 'CHARACTER(LEN=*), INTENT(IN) :: ' + self.name
 
     def use(self):
-        return [('iso_c_binding', 'c_char'), ('iso_c_binding', 'c_null_char')]
+        return _USE_CHAR
 
     def declare_cbinding_fortran(self):
-        return f'CHARACTER(KIND=C_CHAR), INTENT(IN) :: {self.name}(*)'
+        return 'CHARACTER(KIND=C_CHAR), INTENT(IN) :: ' + self.name + '(*)'
 
     def argument(self):
-        return f'{self.name}//c_null_char'
+        return self.name + '//c_null_char'
 
     def c_parameter(self):
-        return f'char *{self.name}'
+        return 'char *' + self.name
 
-@FortranType.add('CHAR_ARRAY_OUT')
-class CharArrayOut(FortranType):
+class CharArrayOut(FortranType, type_name='CHAR_ARRAY_OUT'):
     """Fortran CHAR OUT type."""
-            
-    def declare(self):
-        size = '*' if self.count_param == None else self.count_param
-        return f'CHARACTER(LEN={size}), INTENT(OUT) :: {self.name}'
-    
-    def use(self):
-#       print("self COUNT count_param" + str(self.count_param))
-        if self.count_param == 'MPI_MAX_OBJECT_NAME':
-            return [('iso_c_binding', 'c_char'), ('mpi_f08_types', 'MPI_MAX_OBJECT_NAME')]
-        elif self.count_param == 'MPI_MAX_PORT_NAME':
-            return [('iso_c_binding', 'c_char'), ('mpi_f08_types', 'MPI_MAX_PORT_NAME')]
-        elif self.count_param == 'MPI_MAX_ERROR_STRING':
-            return [('iso_c_binding', 'c_char'), ('mpi_f08_types', 'MPI_MAX_ERROR_STRING')]
-        elif self.count_param == 'MPI_MAX_PROCESSOR_NAME':
-            return [('iso_c_binding', 'c_char'), ('mpi_f08_types', 'MPI_MAX_PROCESSOR_NAME')]
-        elif self.count_param == 'MPI_MAX_LIBRARY_VERSION_STRING':
-            return [('iso_c_binding', 'c_char'), ('mpi_f08_types', 'MPI_MAX_LIBRARY_VERSION_STRING')]
-        elif self.count_param == 'MPI_STATUS_SIZE':
-            return [('iso_c_binding', 'c_char'), ('mpi_f08_types', 'MPI_STATUS_SIZE')]
-        else:
-            return [('iso_c_binding', 'c_char')]
-
-    def declare_cbinding_fortran(self):
-        return f'CHARACTER(KIND=C_CHAR), INTENT(OUT) :: {self.name}(*)'
-        
-    def c_parameter(self):
-        return f'char *{self.name}'
-
-
-@FortranType.add('MESSAGE_OUT')
-class MessageOut(FortranType):
-    """MPI_Message OUT type."""
-
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'TYPE(MPI_Message), INTENT(OUT) :: {self.name}'
-        else:
-            return f'INTEGER, INTENT(OUT) :: {self.name}'
-
-    def use(self):
-        if self.gen_f90 == False:
-            return [('mpi_f08_types', 'MPI_Message')]
-        else:
-            return []
-
-    def c_parameter(self):
-        return f'MPI_Fint *{self.name}'
-    
-
-@FortranType.add('MESSAGE_INOUT')
-class MessageInOut(MessageOut):
-    """MPI_Message INOUT type."""
-
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'TYPE(MPI_Message), INTENT(INOUT) :: {self.name}'
-        else:
-            return f'INTEGER, INTENT(INOUT) :: {self.name}'
-
-
-@FortranType.add('ERRHANDLER')
-class ErrhandlerType(FortranType):
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'TYPE(MPI_Errhandler), INTENT(IN) :: {self.name}'
-        else:
-            return f'INTEGER, INTENT(IN) :: {self.name}'
-        
-    def declare_cbinding_fortran(self):
-        return f'INTEGER, INTENT(IN) :: {self.name}'
-
-    def argument(self):
-        if self.gen_f90 == False:
-            return f'{self.name}%MPI_VAL'
-        else:
-            return f'{self.name}'
-
-    def use(self):
-        if self.gen_f90 == False:
-            return [('mpi_f08_types', 'MPI_Errhandler')]
-        else:
-            return []
+    __slots__ = ()
 
-    def c_parameter(self):
-        return f'MPI_Fint *{self.name}'
+    def _bind_variants(self):
+        size = '*' if self.count_param is None else self.count_param
+        self._declare = f'CHARACTER(LEN={size}), INTENT(OUT) :: '
 
-@FortranType.add('ERRHANDLER_OUT')
-class ErrhandlerOutType(ErrhandlerType):
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'TYPE(MPI_Errhandler), INTENT(OUT) :: {self.name}'
-        else:
-            return f'INTEGER, INTENT(OUT) :: {self.name}'
-        
-    def declare_cbinding_fortran(self):
-        return f'INTEGER, INTENT(OUT) :: {self.name}'
-    
-@FortranType.add('ERRHANDLER_INOUT')
-class ErrhandlerOutType(ErrhandlerOutType):
     def declare(self):
-        if self.gen_f90 == False:
-            return f'TYPE(MPI_Errhandler), INTENT(INOUT) :: {self.name}'
-        else:
-            return f'INTEGER, INTENT(INOUT) :: {self.name}'
-        
-    def declare_cbinding_fortran(self):
-        return f'INTEGER, INTENT(INOUT) :: {self.name}'
-   
-@FortranType.add('COMM_ERRHANDLER_FN')
-class CommErrhandlerFnType(FortranType):
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'PROCEDURE(MPI_Comm_copy_errhandler_function) :: {self.name}'
-        else:
-            return f'EXTERNAL {self.name}'
-
-    def declare_cbinding_fortran(self):
-        return f'INTEGER, INTENT(IN) :: {self.name}'
-
-    def argument(self):
-        if self.gen_f90 == False:
-            return f'{self.name}%MPI_VAL'
-        else:
-            return f'{self.name}'
+        return self._declare + self.name
 
     def use(self):
-        if self.gen_f90 == False:
-           return [('mpi_f08_interfaces_callbacks', 'MPI_Comm_errhandler_function'), ('iso_c_binding', 'c_funloc'), ('iso_c_binding', 'c_funptr')]
-        else:
-           return []
-
-    def declare_tmp(self):
-        return f'type(c_funptr) :: {self.tmp_name}'
+        return _CHAR_OUT_USE.get(self.count_param, _USE_C_CHAR)
 
-    def c_parameter(self):
-        return f'type(c_funptr) :: {self.tmp_name}'
-
-    def pre_c_call(self): 
-        return f'{self.tmp_name} = c_funloc({self.name})'
-
-@FortranType.add('COMM_COPY_ATTR_FN')
-class CommCopyAttrFnType(FortranType):
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'PROCEDURE(MPI_Comm_copy_attr_function) :: {self.name}'
-        else:
-            return f'EXTERNAL {self.name}'
-        
     def declare_cbinding_fortran(self):
-        return f'type(c_funptr) :: {self.name}'
-    
-    def argument(self):
-        return f'{self.tmp_name}'
-    
-    def declare_tmp(self):
-        return f'type(c_funptr)::{self.tmp_name}'
-
-    def use(self):
-        if self.gen_f90 == False:
-            return [('mpi_f08_interfaces_callbacks', 'MPI_Comm_copy_attr_function'), ('iso_c_binding', 'c_funloc'), ('iso_c_binding', 'c_funptr')]
-        else:
-            return []
+        return 'CHARACTER(KIND=C_CHAR), INTENT(OUT) :: ' + self.name + '(*)'
         
     def c_parameter(self):
-        return f'ompi_aint_copy_attr_function {self.name}'
-    
-    def pre_c_call(self): 
-        return f'{self.tmp_name} = c_funloc({self.name})'
-
-@FortranType.add('TYPE_COPY_ATTR_FN')
-class TypeCopyAttrFnType(CommCopyAttrFnType):
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'PROCEDURE(MPI_Type_copy_attr_function) :: {self.name}'
-        else:
-            return f'EXTERNAL {self.name}'
-        
-    def use(self):
-        if self.gen_f90 == False:
-            return [('mpi_f08_interfaces_callbacks', 'MPI_Type_copy_attr_function'), ('iso_c_binding', 'c_funloc'), ('iso_c_binding', 'c_funptr')]
-        else:
-            return []
-
-@FortranType.add('WIN_COPY_ATTR_FN')
-class WinCopyAttrFnType(CommCopyAttrFnType):
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'PROCEDURE(MPI_Win_copy_attr_function) :: {self.name}'
-        else:
-            return f'EXTERNAL {self.name}'
-
-    def use(self):
-        if self.gen_f90 == False:
-            return [('mpi_f08_interfaces_callbacks', 'MPI_Win_copy_attr_function'), ('iso_c_binding', 'c_funloc'), ('iso_c_binding', 'c_funptr')]
-        else:
-            return []
+        return 'char *' + self.name
 
-@FortranType.add('COMM_DELETE_ATTR_FN')
-class CommDeleteAttrFnType(FortranType):
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'PROCEDURE(MPI_Comm_delete_attr_function) :: {self.name}'
-        else:
-            return f'EXTERNAL {self.name}'
 
-    def declare_cbinding_fortran(self):
-        return f'type(c_funptr) :: {self.name}'
+class CallbackFnType(FortranType):
+    """Procedure (callback) argument, passed to C as a c_funptr.
 
-    def argument(self):
-        return f'{self.tmp_name}'
-
-    def declare_tmp(self):
-        return f'type(c_funptr) :: {self.tmp_name}'
-
-    def use(self):
-        if self.gen_f90 == False:
-            return [('mpi_f08_interfaces_callbacks', 'MPI_Comm_delete_attr_function'), ('iso_c_binding', 'c_funloc'), ('iso_c_binding', 'c_funptr')]
-        else:
-            return []
-
-    def c_parameter(self):
-        return f'ompi_aint_delete_attr_function {self.name}'
-
-    def pre_c_call(self):
-        return f'{self.tmp_name} = c_funloc({self.name})'
-
-@FortranType.add('TYPE_DELETE_ATTR_FN')
-class TypeDeleteAttrFnType(CommDeleteAttrFnType):
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'PROCEDURE(MPI_Type_delete_attr_function) :: {self.name}'
-        else:
-            return f'EXTERNAL {self.name}'
-
-    def use(self):
-        if self.gen_f90 == False:
-            return [('mpi_f08_interfaces_callbacks', 'MPI_Type_delete_attr_function'), ('iso_c_binding', 'c_funloc'), ('iso_c_binding', 'c_funptr')]
-        else:
-            return []
-
-@FortranType.add('WIN_DELETE_ATTR_FN')
-class WinDeleteAttrFnType(CommDeleteAttrFnType):
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'PROCEDURE(MPI_Win_delete_attr_function) :: {self.name}'
-        else:
-            return f'EXTERNAL {self.name}'
-
-    def use(self):
-        if self.gen_f90 == False:
-            return [('mpi_f08_interfaces_callbacks', 'MPI_Win_delete_attr_function'), ('iso_c_binding', 'c_funloc'), ('iso_c_binding', 'c_funptr')]
-        else:
-            return []
-
-
-@FortranType.add('COMM_ERRHANDLER_FN')
-class CommErrhandlerFnType(FortranType):
-    def declare(self): 
-        if self.gen_f90 == False:
-            return f'PROCEDURE(MPI_Comm_errhandler_function) :: {self.name}'
-        else:
-            return f'EXTERNAL {self.name}'
-        
-    def declare_cbinding_fortran(self):
-        return f'type(c_funptr) :: {self.name}'
-
-    def argument(self):
-        return f'{self.tmp_name}'
-    
-    def declare_tmp(self):
-        return f'type(c_funptr) :: {self.tmp_name}'
-        
-    def use(self):
-        if self.gen_f90 == False:
-            return [('mpi_f08_interfaces_callbacks', 'MPI_Comm_errhandler_function'), ('iso_c_binding', 'c_funloc'), ('iso_c_binding', 'c_funptr')]
-        else:
-            return []
-        
-    def c_parameter(self):
-        return f'ompi_errhandler_fortran_handler_fn_t {self.name}'
-    
-    def pre_c_call(self):
-        return f'{self.tmp_name} = c_funloc({self.name})'
-
-
-@FortranType.add('FILE_ERRHANDLER_FN')
-class FileErrhandlerFnType(CommErrhandlerFnType):
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'PROCEDURE(MPI_File_errhandler_function) :: {self.name}'
-        else:
-            return f'EXTERNAL {self.name}'
-
-    def use(self):
-        if self.gen_f90 == False:
-            return [('mpi_f08_interfaces_callbacks', 'MPI_File_errhandler_function'), ('iso_c_binding', 'c_funloc'), ('iso_c_binding', 'c_funptr')]
-        else:
-            return []
-
-@FortranType.add('SESSION_ERRHANDLER_FN')
-class SessionErrhandlerFnType(CommErrhandlerFnType):
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'PROCEDURE(MPI_Session_errhandler_function) :: {self.name}'
-        else:
-            return f'EXTERNAL {self.name}'
-
-    def use(self):
-        return [('mpi_f08_interfaces_callbacks', 'MPI_Session_errhandler_function'), ('iso_c_binding', 'c_funloc'), ('iso_c_binding', 'c_funptr')]
-
-@FortranType.add('WIN_ERRHANDLER_FN')
-class WinErrhandlerFnType(CommErrhandlerFnType):
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'PROCEDURE(MPI_Win_errhandler_function) :: {self.name}'
-        else:
-            return f'EXTERNAL {self.name}'
-
-    def use(self):
-        if self.gen_f90 == False:
-            return [('mpi_f08_interfaces_callbacks', 'MPI_Win_errhandler_function'), ('iso_c_binding', 'c_funloc'), ('iso_c_binding', 'c_funptr')]
-        else:
-            return []
-
-@FortranType.add('DATAREP_CONVERSION_FN')
-class DataRepConversionFnType(FortranType):
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'PROCEDURE(MPI_Datarep_conversion_function) :: {self.name}'
-        else:
-            return f'EXTERNAL {self.name}'
+    Concrete callback types are generated from _CALLBACK_TABLE below;
+    they differ only in the PROCEDURE interface name and the C-side
+    parameter type.
+    """
+    __slots__ = ('_tmp_decl', '_pre_c_call')
+    HAS_TMP_DECL = True
+    HAS_PRE_C_CALL = True
+    # Set per generated class from the table.
+    _DECL_F08 = None
+    _CPAR_PREFIX = None
+    _USE_F08 = ()
+    _USE_F90 = _USE_EMPTY
+    # The copy-attr types historically omit the spaces around '::' in the
+    # temporary declaration.
+    _TMP_DECL_SEP = ' :: '
+
+    def _bind_variants(self):
+        if not self.gen_f90:
+            self._declare = self._DECL_F08 + self.name
+            self._use = self._USE_F08
+        else:
+            self._declare = 'EXTERNAL ' + self.name
+            self._use = self._USE_F90
+        self._tmp_decl = 'type(c_funptr)' + self._TMP_DECL_SEP + self.tmp_name
+        self._pre_c_call = self.tmp_name + ' = c_funloc(' + self.name + ')'
+        self._cpar = self._CPAR_PREFIX + self.name
+
+    def declare(self):
+        return self._declare
 
     def declare_cbinding_fortran(self):
-        return f'type(c_funptr) :: {self.name}'
+        return 'type(c_funptr) :: ' + self.name
 
     def argument(self):
-        return f'{self.tmp_name}'
+        return self.tmp_name
 
     def declare_tmp(self):
-        return f'type(c_funptr) :: {self.tmp_name}'
+        return self._tmp_decl
 
     def use(self):
-        if self.gen_f90 == False:
-            return [('mpi_f08_interfaces_callbacks', 'MPI_Datarep_conversion_function'), ('iso_c_binding', 'c_funloc'), ('iso_c_binding', 'c_funptr')]
-        else:
-            return []
+        return self._use
 
     def c_parameter(self):
-        return f'ompi_mpi2_fortran_datarep_conversion_fn_t  {self.name}'
+        return self._cpar
 
     def pre_c_call(self):
-        return f'{self.tmp_name} = c_funloc({self.name})'
-
-@FortranType.add('DATAREP_EXTENT_FN')
-class DataRepExtentFnType(DataRepConversionFnType):
-    def declare(self):
-        if self.gen_f90 == False:
-            return f'PROCEDURE(MPI_Datarep_extent_function) :: {self.name}'
-        else:
-            return f'EXTERNAL {self.name}'
-
-    def use(self):
-        if self.gen_f90 == False:
-            return [('mpi_f08_interfaces_callbacks', 'MPI_Datarep_extent_function'), ('iso_c_binding', 'c_funloc'), ('iso_c_binding', 'c_funptr')]
-        else:
-            return []
-
-    def c_parameter(self):
-        return f'ompi_mpi2_fortran_datarep_extent_fn_t  {self.name}'
+        return self._pre_c_call
+
+
+_CPAR_ERRHANDLER = 'ompi_errhandler_fortran_handler_fn_t '
+_CPAR_COPY_ATTR = 'ompi_aint_copy_attr_function '
+_CPAR_DELETE_ATTR = 'ompi_aint_delete_attr_function '
+# The datarep prefixes historically carry a double space.
+_CPAR_DATAREP_CONVERSION = 'ompi_mpi2_fortran_datarep_conversion_fn_t  '
+_CPAR_DATAREP_EXTENT = 'ompi_mpi2_fortran_datarep_extent_fn_t  '
+
+# type name -> (PROCEDURE interface name, C parameter prefix, class overrides)
+_CALLBACK_TABLE = {
+    'COMM_ERRHANDLER_FN': ('MPI_Comm_errhandler_function', _CPAR_ERRHANDLER, {}),
+    'FILE_ERRHANDLER_FN': ('MPI_File_errhandler_function', _CPAR_ERRHANDLER, {}),
+    # SESSION_ERRHANDLER_FN keeps its use() modules for the f90 interface
+    # as well, unlike the other errhandler callbacks.
+    'SESSION_ERRHANDLER_FN': ('MPI_Session_errhandler_function', _CPAR_ERRHANDLER,
+                              {'_USE_F90': _use_callback('MPI_Session_errhandler_function')}),
+    'WIN_ERRHANDLER_FN': ('MPI_Win_errhandler_function', _CPAR_ERRHANDLER, {}),
+    'COMM_COPY_ATTR_FN': ('MPI_Comm_copy_attr_function', _CPAR_COPY_ATTR,
+                          {'_TMP_DECL_SEP': '::'}),
+    'TYPE_COPY_ATTR_FN': ('MPI_Type_copy_attr_function', _CPAR_COPY_ATTR,
+                          {'_TMP_DECL_SEP': '::'}),
+    'WIN_COPY_ATTR_FN': ('MPI_Win_copy_attr_function', _CPAR_COPY_ATTR,
+                         {'_TMP_DECL_SEP': '::'}),
+    'COMM_DELETE_ATTR_FN': ('MPI_Comm_delete_attr_function', _CPAR_DELETE_ATTR, {}),
+    'TYPE_DELETE_ATTR_FN': ('MPI_Type_delete_attr_function', _CPAR_DELETE_ATTR, {}),
+    'WIN_DELETE_ATTR_FN': ('MPI_Win_delete_attr_function', _CPAR_DELETE_ATTR, {}),
+    'DATAREP_CONVERSION_FN': ('MPI_Datarep_conversion_function',
+                              _CPAR_DATAREP_CONVERSION, {}),
+    'DATAREP_EXTENT_FN': ('MPI_Datarep_extent_function', _CPAR_DATAREP_EXTENT, {}),
+}
+
+
+def _make_callback_type(tag, proc, cpar_prefix, overrides):
+    """Create one concrete callback class from a _CALLBACK_TABLE entry."""
+    name = ''.join(part.capitalize() for part in tag.split('_')) + 'Type'
+    attrs = _template_attrs(CallbackFnType)
+    attrs.update({
+        '__doc__': f'{proc} callback type.',
+        '__slots__': CallbackFnType.__slots__,
+        '_DECL_F08': f'PROCEDURE({proc}) :: ',
+        '_CPAR_PREFIX': cpar_prefix,
+        '_USE_F08': _use_callback(proc),
+    })
+    attrs.update(overrides)
+    return type(name, (FortranType,), attrs)
+
+
+for _tag, _entry in _CALLBACK_TABLE.items():
+    FortranType.register(_tag, _make_callback_type(_tag, *_entry))
+
+
+# Every type is registered while this module is imported; freeze the
+# registry afterwards so lookups go against a stable read-only mapping.
+FortranType.TYPES = types.MappingProxyType(FortranType.TYPES)
@@ -7,17 +7,29 @@
 #
 # $HEADER$
 """Utility code for OMPI binding generation."""
+import io
 import textwrap
 
 
 class OutputFile:
-    """Output file of script."""
+    """Output file of script.
+
+    dump() collects everything in an in-memory buffer; flush() hands the
+    whole generated file to the underlying file object in one write
+    instead of one write per line.
+    """
 
     def __init__(self, fp):
         self.fp = fp
+        self._buffer = io.StringIO()
 
     def dump(self, *pargs, **kwargs):
-        print(*pargs, **kwargs, file=self.fp)
+        print(*pargs, **kwargs, file=self._buffer)
+
+    def flush(self):
+        """Write the buffered output to the underlying file."""
+        self.fp.write(self._buffer.getvalue())
+        self._buffer = io.StringIO()
 
 
 def prepare_text(text):
@@ -70,7 +82,7 @@ def ext_api_func_name_profile(fn_name, bigcount=False):
 def fortran_name(fn_name, bigcount=False, needs_ts=False, gen_f90=False):
     """Produce the final f08 name from base_name. See section 19.2 of MPI 4.1 standard."""
     name = ''
-    if gen_f90 == False:
+    if not gen_f90:
         suffix = '_c' if bigcount else ''
         ts = 'ts' if needs_ts else ''
         name = f'MPI_{fn_name.capitalize()}{suffix}_f08{ts}'